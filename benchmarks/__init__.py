@@ -0,0 +1,2 @@
+"""Benchmarks for ssvlogger, run with `python -m benchmarks` from the
+repository root"""
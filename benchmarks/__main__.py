@@ -0,0 +1,82 @@
+# pylint: disable=C0116, C0114
+
+import argparse
+import os
+import sys
+import tempfile
+
+from benchmarks import harness
+from benchmarks.generator import FORMATS, generate, parse_mix
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Generate synthetic SSV logs and benchmark ssvlogger on them.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("generate", help="Write a synthetic log to stdout")
+    gen.add_argument("-n", "--lines", type=int, default=100000)
+    gen.add_argument("-f", "--format", choices=FORMATS, default="docker")
+    gen.add_argument("--mix", type=parse_mix, help="e.g. debug=40,silent=30,matched=30")
+    gen.add_argument("--seed", type=int, default=0)
+
+    startup = commands.add_parser(
+        "startup",
+        help="Measure the startup time, failing when it is over the target",
+    )
+    startup.add_argument("--repeat", type=int, default=5)
+
+    run = commands.add_parser("run", help="Measure every format and flag combination")
+    run.add_argument("-n", "--lines", type=int, default=200000)
+    run.add_argument("-f", "--format", choices=FORMATS, action="append")
+    run.add_argument("--mix", type=parse_mix, help="e.g. debug=40,silent=30,matched=30")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--workdir", help="Directory to keep generated logs in")
+    run.add_argument("--save", metavar="FILE", help="Write the results to FILE")
+    run.add_argument("--baseline", metavar="FILE", help="Compare against saved results")
+    run.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed regression against the baseline, as a fraction",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.command == "generate":
+        for line in generate(args.lines, args.format, args.mix, args.seed):
+            sys.stdout.write(line + "\n")
+        return
+
+    if args.command == "startup":
+        startup = harness.measure_startup(args.repeat)
+        print(harness.format_startup(startup), file=sys.stderr)
+        if regressions := harness.startup_regressions(startup, None, 0):
+            print("Regressions:\n - " + "\n - ".join(regressions), file=sys.stderr)
+            sys.exit(1)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+        args.format = tuple(args.format or harness.MODES)
+        report = harness.run(workdir, args)
+
+    if args.save:
+        harness.save(report, args.save)
+
+    if args.baseline:
+        if regressions := harness.compare(report, args.baseline, args.tolerance):
+            print("Regressions:\n - " + "\n - ".join(regressions), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# pylint: disable=C0116, C0114
+
+"""Synthetic SSV node log generator"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator
+
+from ssvlogger import matches
+
+FORMATS = ("docker", "journal", "json")
+
+# Relative weight of each kind of line in the generated stream
+DEFAULT_MIX = {
+    "debug": 40,  # DEBUG lines for any matcher
+    "silent": 30,  # Matchers hidden by --silent
+    "matched": 20,  # Other matchers
+    "root": 5,  # Root-level messages handled in switch_log
+    "unmatched": 3,  # Known components with unknown messages
+    "error": 2,  # Generic ERROR lines
+}
+
+# Matcher keys that are not the message the node actually logs
+MESSAGES = {
+    "' event subscriber": "adding 'head' event subscriber",
+    "arting duty process": "starting duty processing",
+    "malformed event": "malformed event: failed to unpack ValidatorAdded event",
+}
+
+ROLES = ("ATTESTER", "PROPOSER", "SYNC_COMMITTEE", "AGGREGATOR", "VALIDATOR_REGISTRATION")
+
+ERROR = 'failed to connect: dial tcp 127.0.0.1:5052: connect: connection refused \\"x\\"'
+
+# (level, component, message, fields) for root-level messages
+ROOT = [
+    ("INFO", "Observability", "global logger initialized", {}),
+    ("INFO", "MetricsHandler", "setup collection", {"addr": ":15000"}),
+    ("INFO", "Migrations", "applying migrations", {"count": 3}),
+    ("INFO", None, "found network config by name", {"name": "holesky"}),
+    ("INFO", None, "setting ssv network", {"config": json.dumps({"name": "mainnet"})}),
+    ("INFO", None, "setting ssv network", {"network": "hoodi"}),
+    ("INFO", None, "consensus client: connecting", {"address": "http://localhost:5052"}),
+    (
+        "INFO",
+        None,
+        "consensus client: connecting (multi client)",
+        {"addresses": ["http://localhost:5052", "http://backup:5052"]},
+    ),
+    ("INFO", None, "applying migrations", {"count": 2}),
+    ("INFO", None, "applied migrations successfully", {"count": 2}),
+    ("INFO", None, "successfully loaded operator keys", {"pubkey": "LS0tLS1CRUdJTi" * 4}),
+    (
+        "INFO",
+        None,
+        "historical registry sync stats",
+        {
+            "my_operator_id": 42,
+            "operators": 1200,
+            "validators": 40000,
+            "liquidated_validators": 12,
+            "my_validators": 8,
+        },
+    ),
+    (
+        "INFO",
+        None,
+        "increasing MaxPeers to match the operator's subscribed subnets",
+        {"old_max_peers": 60, "new_max_peers": 90},
+    ),
+    ("INFO", "operator", "🚀 OPERATOR SUCCESSFULLY CONFIGURED", {}),
+    (
+        "ERROR",
+        None,
+        "consensus node is not healthy",
+        {"node": "http://localhost:5052", "error": ERROR, "errorVerbose": "stack\\ntrace"},
+    ),
+    ("WARN", None, "not all nodes are healthy", {"healthy": 1}),
+    (
+        "WARN",
+        None,
+        "ethereum node(s) are either out of sync or down. "
+        + "Ensure the nodes are healthy to resume.",
+        {"nodes": 2},
+    ),
+    ("INFO", None, "starting event listener", {}),
+    ("INFO", None, "using badger db", {"path": "/data/db"}),
+    ("INFO", None, "three extra fields", {"a": 1, "b": 2, "c": 3}),
+]
+
+
+def hexstr(rng: random.Random, length: int) -> str:
+    return f"{rng.getrandbits(length * 4):0{length}x}"
+
+
+def fields(rng: random.Random, slot: int) -> dict[str, Any]:
+    """Returns a set of fields that satisfies every matcher"""
+
+    role = rng.choice(ROLES)
+    return {
+        "slot": slot,
+        "block_root": "0x" + hexstr(rng, 64),
+        "topic": rng.choice(("head", "block", "finalized_checkpoint")),
+        "subscriber_identifier": "duty_scheduler",
+        "count": rng.randint(1, 500),
+        "address": "http://localhost:5052",
+        "error": ERROR,
+        "errorVerbose": "stack\\ntrace",
+        "client": "lighthouse",
+        "version": "v5.3.0",
+        "topics": ["head", "block"],
+        "handler": role,
+        "role": role,
+        "runner_role": role + "_RUNNER",
+        "committee_id": hexstr(rng, 64),
+        "total_consensus_time": f"{rng.uniform(0.05, 3):.6f}",
+        "pubkey": hexstr(rng, 96),
+        "blinded": rng.random() < 0.5,
+        "block_hash": "0x" + hexstr(rng, 64),
+        "tx_hash": "0x" + hexstr(rng, 64),
+        "hash": "0x" + hexstr(rng, 64),
+        "name": "ValidatorAdded",
+        "from_block": 1000000 + slot,
+        "last_processed_block": 1000100 + slot,
+        "events": rng.randint(0, 100),
+        "progress": f"{rng.uniform(0, 100):.2f}%",
+        "took": f"{rng.randint(1, 900)}ms",
+        "conn_dir": rng.choice(("inbound", "outbound")),
+        "remote_addr": f"/ip4/10.0.{rng.randint(0, 255)}.{rng.randint(0, 255)}/tcp/13001",
+        "peer_id": "16Uiu2HAm" + hexstr(rng, 44),
+        "selfPeer": "16Uiu2HAm" + hexstr(rng, 44),
+        "bootnodes": ["enr:-abc", "enr:-def"],
+        "pool_size": rng.randint(1, 60),
+        "status": rng.choice(("active", "pending", "exited")),
+        "shares count": rng.randint(1, 50),
+        "missing_metadata": rng.randint(0, 3),
+        "failures": rng.randint(0, 3),
+        "initialized": rng.randint(0, 50),
+        "shares": rng.randint(1, 50),
+        "current_data_version": 4,
+        "ALTAIR": 74240,
+        "BELLATRIX": 144896,
+        "CAPELLA": 194048,
+    }
+
+
+def matcher_entries() -> dict[str, list[tuple[str, str]]]:
+    """Returns (component, message) pairs for every key of every matcher
+    table, split into silent and non-silent ones"""
+
+    entries: dict[str, list[tuple[str, str]]] = {"silent": [], "matched": []}
+    for name in matches.__all__:
+        component = name.replace("_", ".")
+        if name.islower():  # Lower case aliases are logged as-is
+            component = name
+        for key, (_, silent) in matches.load(name).items():
+            entries["silent" if silent else "matched"].append(
+                (component, MESSAGES.get(key, key))
+            )
+    return entries
+
+
+def format_line(fmt: str, time: datetime, log: tuple[str, str | None, str, dict]) -> str:
+    """Formats a (level, component, message, extra fields) log"""
+
+    level, component, message, extra = log
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S.") + f"{time.microsecond:06d}Z"
+
+    if fmt == "json":
+        data: dict[str, Any] = {"L": level, "T": stamp}
+        if component is not None:
+            data["N"] = component
+        data["M"] = message
+        data.update(extra)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    parts = [stamp, level]
+    if component is not None:
+        parts.append(component)
+    parts.append(message)
+    if extra:
+        parts.append(json.dumps(extra, ensure_ascii=False))
+    line = "\t".join(parts)
+
+    if fmt == "journal":
+        prefix = time.strftime("%b %d %H:%M:%S")
+        line = f"{prefix} node ssv[1234]: {line}"
+    return line
+
+
+def generate(
+    count: int,
+    fmt: str = "docker",
+    mix: dict[str, float] | None = None,
+    seed: int = 0,
+) -> Iterator[str]:
+    """Yields `count` log lines in the given format.
+
+    Every matcher key and root-level case is emitted at least once before
+    the rest of the stream is drawn according to `mix`.
+    """
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt}, expected one of {FORMATS}")
+
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    entries = matcher_entries()
+    entries["debug"] = entries["silent"] + entries["matched"]
+    kinds = list(mix.keys())
+    weights = list(mix.values())
+
+    time = datetime(2024, 9, 1, tzinfo=timezone.utc)
+
+    # Full coverage first, then the weighted stream
+    fixed = [("INFO", c, m, None) for c, m in entries["debug"]]
+    fixed += list(ROOT)
+
+    for i in range(count):
+        time += timedelta(milliseconds=rng.randint(0, 40))
+        slot = 9000000 + int((time.timestamp() - 1725148800) // 12)
+
+        if i < len(fixed):
+            log = fixed[i]
+            if log[3] is None:
+                log = (*log[:3], fields(rng, slot))
+        else:
+            log = draw(rng, entries, rng.choices(kinds, weights)[0], slot)
+
+        yield format_line(fmt, time, log)
+
+
+def draw(
+    rng: random.Random, entries: dict[str, list[tuple[str, str]]], kind: str, slot: int
+) -> tuple[str, str | None, str, dict]:
+    """Draws a (level, component, message, extra fields) log of a kind"""
+
+    if kind in ("silent", "matched", "debug"):
+        component, message = rng.choice(entries[kind])
+        level = "DEBUG" if kind == "debug" else "INFO"
+        return level, component, message, fields(rng, slot)
+    if kind == "root":
+        level, component, message, extra = rng.choice(ROOT)
+        return level, component, message, dict(extra)
+    if kind == "unmatched":
+        component, _ = rng.choice(entries["matched"])
+        return "INFO", component, "unrecognised message", {"slot": slot}
+    return "ERROR", None, "could not execute duty", {"error": ERROR, "slot": slot}
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parses a mix such as `debug=40,silent=30,matched=30`"""
+
+    mix = {}
+    for part in spec.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in DEFAULT_MIX:
+            raise ValueError(f"Unknown line kind {kind}, expected one of {list(DEFAULT_MIX)}")
+        mix[kind] = float(weight)
+    return mix
@@ -0,0 +1,260 @@
+# pylint: disable=C0116, C0114
+
+"""Throughput, latency and memory measurements for ssvlogger"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any
+
+from benchmarks.generator import generate
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Flag combinations measured for every input format
+FLAGS = ([], ["--silent"], ["--verbose"], ["--traceback"])
+
+# Command line used for each input format, the input path is appended for
+# the json format and piped to stdin otherwise
+MODES = {
+    "docker": [],
+    "journal": ["-j"],
+    "json": [],
+}
+
+# Lines timed in-process to get the per-line latency distribution
+LATENCY_SAMPLE = 20000
+
+# Target for the time `python -X importtime` reports for importing
+# ssvlogger.logger, in milliseconds. Short pipelines (cron jobs, one-shot
+# journalctl queries) pay it on every run.
+STARTUP_TARGET_MS = 80.0
+
+
+def write_input(directory: str, fmt: str, count: int, mix: dict | None, seed: int) -> str:
+    path = os.path.join(directory, f"{fmt}-{count}-{seed}.log")
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as out:
+            for line in generate(count, fmt, mix, seed):
+                out.write(line + "\n")
+    return path
+
+
+def environment() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def run_process(fmt: str, flags: list[str], path: str) -> tuple[float, int]:
+    """Runs ssvlogger over a file, returns wall time and peak RSS in KiB"""
+
+    cmd = [sys.executable, "-m", "ssvlogger.logger", *MODES[fmt], *flags]
+
+    if fmt == "json":
+        cmd.append(path)
+        path = os.devnull
+
+    with (
+        open(os.devnull, "w", encoding="utf-8") as devnull,
+        open(path, "rb") as inp,
+    ):
+        start = time.perf_counter()
+        with subprocess.Popen(cmd, stdin=inp, stdout=devnull, env=environment()) as proc:
+            _, status, usage = os.wait4(proc.pid, 0)
+            elapsed = time.perf_counter() - start
+            proc.returncode = os.waitstatus_to_exitcode(status)
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} exited with {proc.returncode}")
+
+    return elapsed, usage.ru_maxrss
+
+
+def measure_startup(repeat: int = 5) -> dict[str, float]:
+    """Times starting ssvlogger, keeping the best of `repeat` runs: the
+    import time of ssvlogger.logger as reported by `python -X importtime`,
+    and the wall time of a run over empty input, in milliseconds"""
+
+    imports, runs = [], []
+
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import ssvlogger.logger"],
+            capture_output=True,
+            text=True,
+            env=environment(),
+            check=True,
+        )
+        # import time: self [us] | cumulative | imported package
+        for line in proc.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == "ssvlogger.logger":
+                imports.append(int(fields[1]) / 1000)
+
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "ssvlogger.logger"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            env=environment(),
+            check=True,
+        )
+        runs.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "import_ms": min(imports),
+        "run_ms": min(runs),
+        "target_ms": STARTUP_TARGET_MS,
+    }
+
+
+def format_startup(startup: dict[str, float]) -> str:
+    return (
+        f"startup  import {startup['import_ms']:.1f} ms "
+        + f"(target {startup['target_ms']:.0f} ms)  run {startup['run_ms']:.1f} ms"
+    )
+
+
+def percentile(values: list[int], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def measure_latency(fmt: str, flags: list[str], path: str) -> dict[str, float]:
+    """Times the rendering of individual lines in-process, in microseconds"""
+
+    # pylint: disable=import-outside-toplevel
+    from ssvlogger import logger
+
+    args = logger.parse_args([*MODES[fmt], *flags])
+    render = logger.render_json_line if fmt == "json" else logger.render_line
+
+    timings = []
+    clock = time.perf_counter_ns
+    with open(path, "r", encoding="utf-8") as inp:
+        for _, line in zip(range(LATENCY_SAMPLE), inp):
+            line = line.rstrip("\n")
+            start = clock()
+            render(line, args)
+            timings.append(clock() - start)
+
+    timings.sort()
+    return {
+        "mean_us": sum(timings) / len(timings) / 1000,
+        "p50_us": percentile(timings, 0.5) / 1000,
+        "p99_us": percentile(timings, 0.99) / 1000,
+    }
+
+
+def run(directory: str, options: Any) -> dict[str, Any]:
+    """Benchmarks every format of `options.format` with every flag
+    combination on `options.lines` generated lines, keeping the best of
+    `options.repeat` runs for throughput"""
+
+    results = []
+    count = options.lines
+
+    for fmt in options.format:
+        path = write_input(directory, fmt, count, options.mix, options.seed)
+        for combo in FLAGS:
+            runs = [run_process(fmt, combo, path) for _ in range(options.repeat)]
+            elapsed = min(r[0] for r in runs)
+            result = {
+                "format": fmt,
+                "flags": " ".join(combo),
+                "lines": count,
+                "seconds": elapsed,
+                "lines_per_sec": count / elapsed,
+                "max_rss_kib": max(r[1] for r in runs),
+            }
+            result.update(measure_latency(fmt, combo, path))
+            results.append(result)
+            print(format_result(result), file=sys.stderr)
+
+    startup = measure_startup()
+    print(format_startup(startup), file=sys.stderr)
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "lines": count,
+        "seed": options.seed,
+        "startup": startup,
+        "results": results,
+    }
+
+
+def format_result(result: dict[str, Any]) -> str:
+    return (
+        f"{result['format']:<8} {result['flags'] or '-':<12} "
+        + f"{result['lines_per_sec']:>10.0f} lines/s  "
+        + f"p50 {result['p50_us']:>7.1f} us  p99 {result['p99_us']:>7.1f} us  "
+        + f"rss {result['max_rss_kib'] / 1024:>6.1f} MiB"
+    )
+
+
+def save(report: dict[str, Any], path: str):
+    with open(path, "w", encoding="utf-8") as out:
+        json.dump(report, out, indent=2)
+
+
+def compare(report: dict[str, Any], baseline_path: str, tolerance: float) -> list[str]:
+    """Returns a description of every result that regressed by more than
+    `tolerance` (a fraction) against a saved baseline"""
+
+    with open(baseline_path, "r", encoding="utf-8") as inp:
+        baseline = json.load(inp)
+
+    previous = {(r["format"], r["flags"]): r for r in baseline["results"]}
+    regressions = []
+
+    for result in report["results"]:
+        if (old := previous.get((result["format"], result["flags"]))) is None:
+            continue
+
+        name = f"{result['format']} {result['flags'] or '(no flags)'}"
+        speed = result["lines_per_sec"] / old["lines_per_sec"]
+        memory = result["max_rss_kib"] / old["max_rss_kib"]
+        latency = result["p99_us"] / old["p99_us"]
+
+        print(
+            f"{name:<24} throughput {speed - 1:+7.1%}  p99 {latency - 1:+7.1%}"
+            + f"  rss {memory - 1:+7.1%}",
+            file=sys.stderr,
+        )
+
+        if speed < 1 - tolerance:
+            regressions.append(f"{name}: throughput down {1 - speed:.1%}")
+        if memory > 1 + tolerance:
+            regressions.append(f"{name}: peak RSS up {memory - 1:.1%}")
+
+    if (startup := report.get("startup")) is not None:
+        regressions.extend(startup_regressions(startup, baseline.get("startup"), tolerance))
+
+    return regressions
+
+
+def startup_regressions(
+    startup: dict[str, float], old: dict[str, float] | None, tolerance: float
+) -> list[str]:
+    """Returns a description of the startup time exceeding its target or
+    regressing by more than `tolerance` against a baseline"""
+
+    regressions = []
+
+    if startup["import_ms"] > startup["target_ms"]:
+        regressions.append(
+            f"startup: import takes {startup['import_ms']:.1f} ms, "
+            + f"over the {startup['target_ms']:.0f} ms target"
+        )
+
+    if old is not None:
+        change = startup["import_ms"] / old["import_ms"]
+        print(f"{'startup':<24} import {change - 1:+7.1%}", file=sys.stderr)
+        if change > 1 + tolerance:
+            regressions.append(f"startup: import time up {change - 1:.1%}")
+
+    return regressions
@@ -0,0 +1,12 @@
+# pylint: disable=C0114
+
+"""Parse SSV node logs and make them legible.
+
+`parse_stream` renders log lines into Records without printing anything,
+for use from other programs. The `ssvlogger` command is built on it.
+"""
+
+from ssvlogger.stream import Parser, parse_stream
+from ssvlogger.structured import Record
+
+__all__ = ["Parser", "Record", "parse_stream"]
@@ -1,5 +1,67 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
+import functools
+import json
+import os
+from typing import Any, Callable
+
+# The fastest available JSON backend is used unless SSVLOGGER_JSON names
+# one of "orjson", "msgspec" or "json"
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+def load_json_backend(
+    preferred: str | None = None,
+) -> tuple[str, Callable[[str | bytes], Any], type[Exception]]:
+    """Returns the name, decode function and error type of a JSON backend"""
+
+    for name in JSON_BACKENDS:
+        if preferred is not None and name != preferred:
+            continue
+        try:
+            if name == "orjson":
+                import orjson  # pylint: disable=import-outside-toplevel, import-error
+
+                return name, orjson.loads, orjson.JSONDecodeError  # pylint: disable=no-member
+            if name == "msgspec":
+                import msgspec  # pylint: disable=import-outside-toplevel, import-error
+
+                return name, msgspec.json.Decoder().decode, msgspec.DecodeError
+        except ImportError:
+            continue
+
+    return "json", json.loads, json.JSONDecodeError
+
+
+# loads() decodes a JSON document from str or bytes, every JSON field of a
+# log line is decoded through it
+JSON_BACKEND, loads, JSONDecodeError = load_json_backend(  # pylint: disable=invalid-name
+    os.environ.get("SSVLOGGER_JSON")
+)
+
+
+def load_json_encoder(backend: str) -> Callable[[Any], str]:
+    """Returns a compact JSON encoder from the same backend as loads()"""
+
+    if backend == "orjson":
+        import orjson  # pylint: disable=import-outside-toplevel, import-error
+
+        return lambda obj: orjson.dumps(obj, default=str).decode()  # pylint: disable=no-member
+    if backend == "msgspec":
+        import msgspec  # pylint: disable=import-outside-toplevel, import-error
+
+        encode = msgspec.json.Encoder(enc_hook=str).encode
+        return lambda obj: encode(obj).decode()
+
+    return functools.partial(
+        json.dumps, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+
+
+# dumps() encodes an object as compact JSON, for --output json
+dumps = load_json_encoder(JSON_BACKEND)
+
+
 def seconds_to_ms_or_s(from_log: str):
     """Converts seconds to milliseconds or seconds"""
 
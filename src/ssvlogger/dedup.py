@@ -0,0 +1,93 @@
+# pylint: disable=C0116, C0114
+
+"""Collapsing repeated messages for --dedup"""
+
+import re
+from collections import OrderedDict
+from datetime import datetime
+
+from ssvlogger.record import LogRecord
+from ssvlogger.render import Fore
+
+# Seconds of log time a message is collapsed for after it is printed
+WINDOW = 60.0
+
+# Most recently seen messages remembered, the least recently seen one is
+# forgotten first
+CACHE_SIZE = 1024
+
+# Parts of a message that change between otherwise identical messages,
+# such as slots, peer counts, hashes and addresses
+VOLATILE = re.compile(r"0x[0-9a-fA-F]+|[0-9a-fA-F]{16,}|\d+")
+
+
+class Deduplicator:
+    """Remembers recently printed messages by a fingerprint of their text
+    with volatile fields normalized. A message seen again within `window`
+    seconds of being printed is counted instead of printed, and the count
+    is reported once the window has passed or the message is forgotten."""
+
+    def __init__(self, window: float = WINDOW, size: int = CACHE_SIZE):
+        self.window = window
+        self.size = size
+        # fingerprint: [printed at, repeats, prefix of the last repeat, message]
+        self.recent: OrderedDict[tuple, list] = OrderedDict()
+        self.clock = ("", 0.0)
+
+    def seconds(self, time: str) -> float:
+        """Log time in seconds, parsed once per second of log time"""
+
+        time = time.rpartition(": ")[2][:19]
+        if time != self.clock[0]:
+            try:
+                self.clock = (time, datetime.fromisoformat(time).timestamp())
+            except ValueError:
+                return self.clock[1]
+        return self.clock[1]
+
+    def check(self, record: LogRecord, prefix: str, message: str) -> tuple[bool, list[str]]:
+        """Returns whether a rendered message should be printed, and the
+        lines reporting repeats of messages that are no longer collapsed.
+        `prefix` is the time and level the message is printed with."""
+
+        now = self.seconds(record.time)
+        key = (record.level, record.component, VOLATILE.sub("#", message))
+        notices = []
+
+        # Forget messages whose window has passed, least recently seen first
+        while self.recent:
+            oldest = next(iter(self.recent.values()))
+            if now - oldest[0] < self.window and len(self.recent) < self.size:
+                break
+            self.recent.popitem(last=False)
+            if oldest[1]:
+                notices.append(repeated(oldest))
+
+        if (entry := self.recent.get(key)) is not None:
+            if now - entry[0] < self.window:
+                entry[1] += 1
+                entry[2] = prefix
+                self.recent.move_to_end(key)
+                return False, notices
+            if entry[1]:
+                notices.append(repeated(entry))
+            del self.recent[key]
+
+        self.recent[key] = [now, 0, prefix, message]
+        return True, notices
+
+    def flush(self) -> list[str]:
+        """Returns the lines reporting all pending repeats"""
+
+        notices = [repeated(entry) for entry in self.recent.values() if entry[1]]
+        self.recent.clear()
+        return notices
+
+
+def repeated(entry: list) -> str:
+    _, count, prefix, message = entry
+    message = message.partition("\n")[0]
+    return (
+        f"{prefix}{Fore.LIGHTBLACK_EX}last message repeated {count} "
+        + f"times{Fore.RESET}: {message}"
+    )
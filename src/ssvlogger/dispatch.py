@@ -0,0 +1,107 @@
+# pylint: disable=C0116, C0114
+
+"""Dispatch index mapping SSV components and messages to their matchers"""
+
+import threading
+from typing import Callable
+
+from ssvlogger import matches
+from ssvlogger.record import LogRecord
+
+Matcher = tuple[Callable[[LogRecord], tuple[str, list[str]] | None], bool]
+
+# Upper bound on memoised lookups, SSV messages are mostly constant strings
+# so this is only reached when a component logs free form text.
+CACHE_LIMIT = 4096
+
+
+class MessageIndex:
+    """Resolves a message to the first matching key of a matcher table.
+
+    Keys are tested in table order, exactly like a linear substring scan,
+    but the result is memoised per message so each distinct message is
+    only scanned once.
+    """
+
+    __slots__ = ("keys", "table", "cache")
+
+    def __init__(self, table: dict[str, Matcher]):
+        self.table = table
+        self.keys = tuple(table.keys())
+        # Unlocked, threads racing on a message only scan it twice and the
+        # cache may grow a little past CACHE_LIMIT
+        self.cache: dict[str, str | None] = {}
+
+    def find(self, message: str) -> str | None:
+        """Returns the first key of the table found in `message`"""
+
+        try:
+            return self.cache[message]
+        except KeyError:
+            pass
+
+        found = None
+        for k in self.keys:
+            if k in message:
+                found = k
+                break
+
+        if len(self.cache) < CACHE_LIMIT:
+            self.cache[message] = found
+        return found
+
+    def lookup(self, message: str) -> Matcher | None:
+        if (key := self.find(message)) is None:
+            return None
+        return self.table[key]
+
+
+# MessageIndex per table name of ssvlogger.matches, built (and the module
+# of the table imported) when a component of the table is first seen
+INDEX: dict[str, MessageIndex] = {}
+
+# Held while building an index so threads rendering without the GIL do not
+# build two for one table, nor load a table module twice
+_lock = threading.Lock()
+
+
+def table_index(name: str) -> MessageIndex | None:
+    """Returns the MessageIndex of a table exported by ssvlogger.matches"""
+
+    if (index := INDEX.get(name)) is not None or name not in matches.TABLES:
+        return index
+
+    with _lock:
+        if (index := INDEX.get(name)) is not None:
+            return index
+
+        table = matches.load(name)
+        # Aliases such as Operator_DutyScheduler share the same table
+        for other in INDEX.values():
+            if other.table is table:
+                index = other
+                break
+        else:
+            index = MessageIndex(table)
+
+        INDEX[name] = index
+        return index
+
+
+_components: dict[str, MessageIndex | None] = {}
+
+
+def find_component(component: str) -> MessageIndex | None:
+    """Returns the MessageIndex for an SSV component name such as
+    `Controller.Committee`, or None if no matcher table exists for it"""
+
+    try:
+        return _components[component]
+    except KeyError:
+        pass
+
+    index = table_index(component.replace(".", "_"))
+    with _lock:
+        if len(_components) < CACHE_LIMIT:
+            _components[component] = index
+    return index
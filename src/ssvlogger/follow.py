@@ -0,0 +1,132 @@
+# pylint: disable=C0116, C0114
+
+"""Following a log file as it grows, across rotation and truncation"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import time
+from typing import Iterator
+
+from ssvlogger.reader import CHUNK_SIZE, LineDecoder
+
+# Seconds between checks of the file when inotify is unavailable, also the
+# upper bound on how long a missed inotify event can delay new lines
+POLL_INTERVAL = 0.5
+
+# IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+# | IN_CREATE | IN_DELETE
+INOTIFY_MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+
+def inotify_watch(directory: str) -> int | None:
+    """Returns an inotify descriptor watching `directory`, or None where
+    inotify is not available"""
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), INOTIFY_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def wait(watch: int | None, timeout: float):
+    """Blocks until the watched directory changes or `timeout` passes"""
+
+    if watch is None:
+        time.sleep(timeout)
+        return
+
+    if select.select([watch], [], [], timeout)[0]:
+        try:
+            while os.read(watch, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def open_log(path: str) -> tuple[int, int] | None:
+    """Opens a log file, returning its descriptor and inode"""
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    return fd, os.fstat(fd).st_ino
+
+
+def follow(
+    path: str, from_start: bool = False, poll_interval: float = POLL_INTERVAL
+) -> Iterator[str]:
+    """Yields lines appended to `path` until interrupted, see follow_chunks"""
+
+    for lines in follow_chunks(path, from_start, poll_interval):
+        yield from lines
+
+
+def follow_chunks(
+    path: str, from_start: bool = False, poll_interval: float = POLL_INTERVAL
+) -> Iterator[list[str]]:
+    """Yields the lines appended to `path`, as they are read, until
+    interrupted.
+
+    Reading starts at the end of the file unless `from_start` is set. When
+    the file is replaced (a different inode appears at `path`) the rest of
+    the old file is read before switching to the new one from its start,
+    and when it shrinks below the current offset it is read again from
+    the start.
+    """
+
+    watch = inotify_watch(os.path.dirname(os.path.abspath(path)))
+    decoder = LineDecoder()
+    current = None
+
+    try:
+        while True:
+            if current is None and (current := open_log(path)) is not None:
+                if not from_start:
+                    os.lseek(current[0], 0, os.SEEK_END)
+                from_start = True  # Files appearing later are read in full
+
+            if current is None:
+                wait(watch, poll_interval)
+                continue
+
+            fd, inode = current
+            while data := os.read(fd, CHUNK_SIZE):
+                yield decoder.feed(data)
+
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stat = None
+
+            if stat is not None and stat.st_ino != inode:
+                # Rotated, pick up anything written before the switch
+                while data := os.read(fd, CHUNK_SIZE):
+                    yield decoder.feed(data)
+                yield decoder.finish()
+                os.close(fd)
+                current = None
+                continue
+
+            if stat is not None and stat.st_size < os.lseek(fd, 0, os.SEEK_CUR):
+                # Truncated in place (e.g. copytruncate)
+                decoder.finish()
+                os.lseek(fd, 0, os.SEEK_SET)
+                continue
+
+            wait(watch, poll_interval)
+    finally:
+        if current is not None:
+            os.close(current[0])
+        if watch is not None:
+            os.close(watch)
@@ -0,0 +1,204 @@
+# pylint: disable=C0116, C0114
+
+"""Sidecar index of a log file, recording which blocks of the file hold
+which times, levels and components so filtered runs only read those"""
+
+import hashlib
+import json
+import mmap
+import os
+from typing import Any
+
+from ssvlogger.prefilter import item_time, json_string
+from ssvlogger.record import split_fields
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".ssvidx"
+
+# A block ends when the minute of its lines changes or it grows past this
+BLOCK_SIZE = 1024 * 1024
+
+# Bytes at the start of a line searched for its time, level and component
+HEAD_SIZE = 512
+
+# Bytes at the end of the indexed part of a file checked to tell whether a
+# grown file was appended to rather than replaced
+TAIL_SIZE = 4096
+
+# [start, end, first time, last time, levels, components]
+Block = list[Any]
+
+
+def line_keys(line: str, fmt: str) -> tuple[str | None, str, str]:
+    """Returns the time, level and component of a line, the level and
+    component being "" where the line has none"""
+
+    if fmt == "json":
+        mpos = line.find('"M":"')
+        return (
+            json_string(line, "T"),
+            json_string(line, "L") or "",
+            json_string(line, "N", mpos) or "",
+        )
+
+    if fmt == "journal":  # Skip the syslog prefix, `host ssv[pid]: `
+        line = line.partition(": ")[2]
+
+    # Same rules as parse_line for which field is the component
+    fields = split_fields(line, 5)
+    if len(fields) < 2:
+        return None, "", ""
+    if len(fields) >= 5 or (len(fields) == 4 and not fields[3].startswith("{")):
+        component = fields[2]
+    else:
+        component = ""
+    return item_time(fields[0], "docker"), fields[1], component
+
+
+def tail_hash(mm: mmap.mmap, end: int) -> str:
+    return hashlib.sha1(mm[max(0, end - TAIL_SIZE) : end]).hexdigest()
+
+
+def scan(mm: mmap.mmap, start: int, fmt: str) -> tuple[list[Block], int]:
+    """Indexes the complete lines of a mapped file from `start` on, returning
+    the blocks and the offset indexing stopped at"""
+
+    blocks: list[Block] = []
+    block: Block = []
+    minute = None
+    pos = start
+
+    while (newline := mm.find(b"\n", pos)) >= 0:
+        end = newline + 1
+        head = mm[pos : min(end, pos + HEAD_SIZE)].decode("utf-8", errors="replace")
+        time, level, component = line_keys(head, fmt)
+
+        if not block or pos - block[0] >= BLOCK_SIZE or (
+            time is not None and minute is not None and time[:16] != minute
+        ):
+            block = [pos, end, None, None, set(), set()]
+            blocks.append(block)
+            minute = None
+
+        if time is not None:
+            if block[2] is None:
+                block[2] = time
+                minute = time[:16]
+            block[3] = time
+        block[1] = end
+        block[4].add(level)
+        block[5].add(component)
+        pos = end
+
+    for block in blocks:
+        block[4] = sorted(block[4])
+        block[5] = sorted(block[5])
+
+    return blocks, pos
+
+
+def load_index(path: str, fmt: str) -> dict[str, Any]:
+    """Returns the index of a log file, reading it from the sidecar file
+    where that is up to date, extending it where the log file has grown
+    and rebuilding it otherwise. The sidecar file is rewritten whenever the
+    index changes."""
+
+    stat = os.stat(path)
+    index_path = path + INDEX_SUFFIX
+
+    try:
+        with open(index_path, "r", encoding="utf-8") as inp:
+            index = json.load(inp)
+        if index["version"] != INDEX_VERSION or index["format"] != fmt:
+            index = None
+    except (OSError, ValueError, KeyError, TypeError):
+        index = None
+
+    if (
+        index is not None
+        and index["size"] == stat.st_size
+        and index["mtime"] == stat.st_mtime_ns
+    ):
+        return index
+
+    blocks, indexed, tail = [], 0, ""
+
+    if stat.st_size:
+        with open(path, "rb") as inp:
+            with mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if (
+                    index is not None
+                    and index["indexed"] <= len(mm)
+                    and tail_hash(mm, index["indexed"]) == index["tail"]
+                ):
+                    # Appended to, only index the new lines
+                    blocks, indexed = scan(mm, index["indexed"], fmt)
+                    blocks = index["blocks"] + blocks
+                else:
+                    blocks, indexed = scan(mm, 0, fmt)
+                tail = tail_hash(mm, indexed)
+
+    index = {
+        "version": INDEX_VERSION,
+        "format": fmt,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "indexed": indexed,
+        "tail": tail,
+        "blocks": blocks,
+    }
+
+    try:
+        with open(index_path, "w", encoding="utf-8") as out:
+            json.dump(index, out, separators=(",", ":"))
+    except OSError:  # A read only directory only costs rebuilding next time
+        pass
+
+    return index
+
+
+def block_matches(block: Block, filters: Any) -> bool:
+    """Whether a block can hold lines matching the filters, see
+    select_spans"""
+
+    _, _, first, last, levels, components = block
+    if filters.since is not None and last is not None and last < filters.since:
+        return False
+    if filters.until is not None and first is not None and first >= filters.until:
+        return False
+    if filters.levels is not None and filters.levels.isdisjoint(levels):
+        return False
+    return filters.components is None or not filters.components.isdisjoint(components)
+
+
+def add_span(spans: list[tuple[int, int]], start: int, end: int):
+    """Appends a range, merging it into the last one when adjacent"""
+
+    if spans and spans[-1][1] == start:
+        spans[-1] = (spans[-1][0], end)
+    else:
+        spans.append((start, end))
+
+
+def select_spans(
+    index: dict[str, Any], span: tuple[int, int], filters: Any
+) -> list[tuple[int, int]]:
+    """Returns the (start, end) ranges within `span` of the blocks that can
+    hold lines matching `filters`, merging adjacent blocks. The filters
+    are the `since` and `until` times and the `levels` and `components`
+    sets, each None to match anything."""
+
+    spans: list[tuple[int, int]] = []
+    start, end = span
+
+    for block in index["blocks"]:
+        if block[1] <= start or block[0] >= end:
+            continue
+        if block_matches(block, filters):
+            add_span(spans, max(block[0], start), min(block[1], end))
+
+    # Lines written after the index was built, usually a partial last line
+    if index["indexed"] < end:
+        add_span(spans, max(index["indexed"], start), end)
+
+    return spans
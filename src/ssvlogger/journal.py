@@ -0,0 +1,98 @@
+# pylint: disable=C0116, C0114
+
+"""Reading `journalctl -o json` and `journalctl -o export` output"""
+
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from ssvlogger.common import JSONDecodeError, loads
+from ssvlogger.record import LogRecord, json_record, parse_line
+
+# Journal fields used by ssvlogger, anything else in an entry is skipped
+FIELDS = (b"MESSAGE", b"__REALTIME_TIMESTAMP", b"_SYSTEMD_UNIT", b"_PID")
+
+
+def json_entries(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Yields the entries of `journalctl -o json` output, one per line"""
+
+    for line in lines:
+        if not line:
+            continue
+        try:
+            entry = loads(line)
+        except JSONDecodeError:
+            continue
+        if isinstance(entry, dict):
+            yield entry
+
+
+def export_entries(stream: BinaryIO) -> Iterator[dict[str, Any]]:
+    """Yields the entries of `journalctl -o export` output, `stream` should
+    be buffered (e.g. `sys.stdin.buffer`)"""
+
+    entry: dict[str, Any] = {}
+
+    while line := stream.readline():
+        if line == b"\n":  # Entries are separated by an empty line
+            if entry:
+                yield entry
+                entry = {}
+            continue
+
+        name, eq, value = line.rstrip(b"\n").partition(b"=")
+
+        if not eq:  # Binary field, a little endian size precedes the data
+            size = int.from_bytes(stream.read(8), "little")
+            value = stream.read(size)
+            stream.read(1)
+
+        if name in FIELDS:
+            entry[name.decode()] = value.decode("utf-8", errors="replace")
+
+    if entry:
+        yield entry
+
+
+def is_systemd(entry: dict[str, Any]) -> bool:
+    """Whether an entry was logged by systemd itself rather than the node"""
+
+    return entry.get("_PID") == "1" or entry.get("_SYSTEMD_UNIT") == "init.scope"
+
+
+def message(entry: dict[str, Any]) -> str | None:
+    """Returns the MESSAGE of an entry, which holds the zap formatted line"""
+
+    value = entry.get("MESSAGE")
+    if isinstance(value, list):  # Non UTF-8 messages are arrays of bytes
+        return bytes(value).decode("utf-8", errors="replace")
+    return value
+
+
+def realtime(entry: dict[str, Any]) -> str | None:
+    """Returns the time an entry was received by the journal, in the format
+    zap uses"""
+
+    if (value := entry.get("__REALTIME_TIMESTAMP")) is None:
+        return None
+    stamp = datetime.fromtimestamp(int(value) / 1e6, tz=timezone.utc)
+    return stamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def parse_entry(entry: dict[str, Any], line: str) -> LogRecord | None:
+    """Parses the MESSAGE `line` of a journal entry, which is either a zap
+    console line or a zap JSON line. The journal's own timestamp is used
+    when the line has none."""
+
+    if not line.startswith("{"):
+        return parse_line(line)
+
+    try:
+        data = loads(line)
+    except JSONDecodeError:
+        return None
+    if isinstance(data, dict):  # Zap leaves out the time and level if asked to
+        if not data.get("T"):
+            data["T"] = realtime(entry) or ""
+        data.setdefault("L", "INFO")
+
+    return json_record(data, line)
@@ -0,0 +1,144 @@
+# pylint: disable=C0116, C0114
+
+"""Receiving logs over the network for --listen: newline delimited SSV logs
+or syslog over TCP, and syslog over UDP"""
+
+import asyncio
+import re
+import sys
+from typing import AsyncIterator
+
+from ssvlogger.reader import CHUNK_SIZE, LineDecoder
+from ssvlogger.sources import QUEUE_SIZE, batches
+
+# Bytes buffered per TCP connection before it stops being read, which
+# makes the sender wait (asyncio pauses reading past twice this)
+CONNECTION_BUFFER = 64 * 1024
+
+PROTOCOLS = ("tcp", "udp")
+
+# RFC 5424: <PRI>1 TIMESTAMP HOST APP PROCID MSGID [SD] MSG
+RFC5424 = re.compile(r"<\d{1,3}>1 \S+ (\S+) \S+ \S+ \S+ (?:-|(?:\[(?:[^\]\\]|\\.)*\])+) ?")
+
+# RFC 3164: <PRI>Mmm dd hh:mm:ss HOST TAG[PID]: MSG
+RFC3164 = re.compile(r"<\d{1,3}>[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d (\S+) [^:\s]+: ?")
+
+# A syslog message in neither format, only the priority is removed
+PRIORITY = re.compile(r"<\d{1,3}>")
+
+# (protocol, host, port)
+Address = tuple[str, str, int]
+
+# (peer, line)
+Received = tuple[str, str]
+
+
+def parse_address(spec: str) -> Address:
+    """Parses `[tcp://|udp://][HOST]:PORT`, listening on all interfaces
+    without a host"""
+
+    protocol, sep, address = spec.partition("://")
+    if not sep:
+        protocol, address = "tcp", spec
+    if protocol not in PROTOCOLS:
+        raise ValueError(f"Unknown protocol {protocol}")
+
+    host, sep, port = address.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"No port in {spec}")
+    return protocol, host.strip("[]") or "0.0.0.0", int(port)
+
+
+def syslog_message(line: str, peer: str) -> Received:
+    """Removes the syslog header from a line, if it has one, returning the
+    sending host (or `peer` where it is not known) and the message"""
+
+    if not line.startswith("<"):
+        return peer, line
+    if (match := RFC5424.match(line)) or (match := RFC3164.match(line)):
+        host = match[1]
+        return (peer if host == "-" else host), line[match.end() :]
+    if match := PRIORITY.match(line):
+        return peer, line[match.end() :]
+    return peer, line
+
+
+def received(lines: list[str], peer: str) -> list[list[Received]]:
+    """Splits the lines from a peer into batches of at most BATCH_LINES"""
+
+    return batches([syslog_message(line.rstrip("\r"), peer) for line in lines if line])
+
+
+class SyslogProtocol(asyncio.DatagramProtocol):
+    """Queues syslog messages received over UDP. Datagrams can not be held
+    back, so those arriving while the queue is full are dropped and
+    counted."""
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+        self.dropped = 0
+
+    def datagram_received(self, data: bytes, addr: tuple):
+        lines = data.decode("utf-8", errors="replace").split("\n")
+        for batch in received(lines, addr[0]):
+            try:
+                self.queue.put_nowait(batch)
+            except asyncio.QueueFull:
+                self.dropped += len(batch)
+
+
+async def receive(addresses: list[Address]) -> AsyncIterator[list[Received]]:
+    """Listens on `addresses`, yielding batches of (peer, line) as they are
+    received until cancelled.
+
+    Every TCP connection is read into its own bounded buffer and hands
+    over at most BATCH_LINES lines at a time through one bounded queue, so
+    a connection sending faster than its lines are rendered is no longer
+    read from until there is room, and connections take turns.
+    """
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+
+    async def connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        host, port = writer.get_extra_info("peername")[:2]
+        decoder = LineDecoder()
+        try:
+            while data := await reader.read(CHUNK_SIZE):
+                for batch in received(decoder.feed(data), f"{host}:{port}"):
+                    await queue.put(batch)
+                    await asyncio.sleep(0)  # Let the other connections take their turn
+            for batch in received(decoder.finish(), f"{host}:{port}"):
+                await queue.put(batch)
+        except (ConnectionError, asyncio.CancelledError):
+            # A connection cancelled on exit ends quietly, asyncio logs an
+            # error for cancelled connection handlers
+            pass
+        finally:
+            writer.close()
+
+    servers, endpoints = [], []
+    try:
+        for protocol, host, port in addresses:
+            if protocol == "tcp":
+                server = await asyncio.start_server(
+                    connection, host, port, limit=CONNECTION_BUFFER
+                )
+                servers.append(server)
+                bound = server.sockets[0].getsockname()
+            else:
+                transport, endpoint = await loop.create_datagram_endpoint(
+                    lambda: SyslogProtocol(queue), local_addr=(host, port)
+                )
+                servers.append(transport)
+                endpoints.append(endpoint)
+                bound = transport.get_extra_info("sockname")
+            print(f"Listening on {protocol}://{bound[0]}:{bound[1]}", file=sys.stderr)
+
+        while True:
+            yield await queue.get()
+    finally:
+        for server in servers:
+            server.close()
+        if dropped := sum(endpoint.dropped for endpoint in endpoints):
+            print(f"Dropped {dropped} UDP messages while busy", file=sys.stderr)
@@ -1,52 +1,81 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-# pylint: disable=C0116, C0114, R0912, R0915, W0718, R1732, R0916, R0914
+# pylint: disable=C0116, C0114, R0912, R0915, W0718, R1732, R0916, R0914, C0415
 
 """A simple python string to parse SSV node logs and make them legible"""
 
+import itertools
+import os
+import signal
 import sys
-import json
 import argparse
-from typing import Any, Callable
-import colorama
+from typing import Any, Callable, Iterable, Iterator
+
+from ssvlogger import journal
+from ssvlogger.common import dumps
+from ssvlogger.dedup import WINDOW, Deduplicator
+from ssvlogger.output import BufferedWriter
+from ssvlogger.prefilter import keep_json, keep_line
+from ssvlogger.profiling import Profiler
+from ssvlogger.reader import iter_file_lines, iter_line_chunks, iter_lines
+from ssvlogger.record import LogRecord, detect_format, parse_json, parse_line
+from ssvlogger.render import Fore, template, use_renderer
+from ssvlogger.seek import parse_time, time_range
+from ssvlogger.stream import LEVELS, Parser
+
+
+SOURCE_TAG = template("{LIGHTBLACK_EX}{name}{RESET} ")
+TIME = template("{CYAN}{time}{RESET}")
+LEVEL_COLOURS = {
+    "DEBUG": template("{BLUE}DEBUG{RESET}"),
+    "INFO": template("{GREEN}INFO{RESET}"),
+    "WARN": template("{YELLOW}WARN{RESET}"),
+    "ERROR": template("{LIGHTRED_EX}ERROR{RESET}"),
+    "FATAL": template("{RED}FATAL{RESET}"),
+}
+
+
+def extract_time_and_stat(record: LogRecord, docker_mode):
+    """Extracts time and status from a log"""
+    time = record.time.partition(": ")[2] if not docker_mode else record.time
+    time = TIME.format(time=time.replace("T", " ").split(".", maxsplit=1)[0])
 
-from ssvlogger import matches
+    stat = record.level
+    if (colour := LEVEL_COLOURS.get(stat)) is not None:
+        stat = colour.format()
 
+    return time, stat
 
-def extract_time_and_stat(log, docker_mode):
-    """Extracts time and status from a log"""
-    time = log[0].split(": ", maxsplit=1)[1] if not docker_mode else log[0]
-    time = time.replace("T", " ").split(".", maxsplit=1)[0]
-    time = colorama.Fore.CYAN + time + colorama.Fore.RESET
-
-    stat = log[1]
-
-    if stat == "DEBUG":
-        stat = colorama.Fore.BLUE + stat + colorama.Fore.RESET
-    elif stat == "INFO":
-        stat = colorama.Fore.GREEN + stat + colorama.Fore.RESET
-    elif stat == "WARN":
-        stat = colorama.Fore.YELLOW + stat + colorama.Fore.RESET
-    elif stat == "ERROR":
-        stat = colorama.Fore.LIGHTRED_EX + stat + colorama.Fore.RESET
-    elif stat == "FATAL":
-        stat = colorama.Fore.RED + stat + colorama.Fore.RESET
 
-    return time, stat
+# Formats accepted by --input
+INPUT_FORMATS = ("auto", "docker", "journal", "json", "journal-json", "journal-export")
+JOURNAL_FORMATS = ("journal-json", "journal-export")
+
+# Bytes read at a time from a log file to detect its format
+DETECT_SIZE = 64 * 1024
+
+# Most senders tagged with --listen whose tags are kept
+TAG_CACHE_SIZE = 4096
+
+# Formats accepted by --output
+OUTPUT_FORMATS = ("text", "json", "none")
 
 
-def parse_args() -> Any:
+def parse_args(argv: list[str] | None = None) -> Any:
     parser = argparse.ArgumentParser(
         prog="ssvlogger",
         description="A simple script to parse operational SSV operator logs.",
     )
 
     parser.add_argument(
-        "log_file",
+        "log_files",
         type=str,
-        nargs="?",
-        help="An optional log file to get logs from",
+        nargs="*",
+        metavar="log_file",
+        help="Optional log files or glob patterns to get logs from, "
+        + "compressed (.gz, .xz, .zst) files are decompressed as they are read "
+        + "and several files are merged in timestamp order",
     )
 
     parser.add_argument(
@@ -61,11 +90,43 @@ def parse_args() -> Any:
         "-j",
         "--journal",
         default=False,
-        help="Enforce compatibility with `journalctl -f | "
-        + "ssvlogger -j`, do not use this if using docker or `journalctl -f --output cat`",
+        help="Read `journalctl -f` output, with its syslog prefix. Same as "
+        + "--input journal, the format is detected without it",
         action="store_true",
     )
 
+    parser.add_argument(
+        "--input",
+        choices=INPUT_FORMATS,
+        default=None,
+        help="Format of the logs, auto (the default, journal with -j) detects "
+        + "docker, journal, json or journal-json logs from the first lines. "
+        + "Logs read from stdin are read in the detected format if it is "
+        + "another one. "
+        + "journal-json and journal-export read `journalctl -o json` and "
+        + "`journalctl -o export`, --source, --command and --listen default "
+        + "to docker",
+    )
+
+    parser.add_argument(
+        "--output",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Format of the output, json writes one JSON object per log with "
+        + "its time, level, component, matcher, message and the fields the "
+        + "matcher used, none writes nothing (for --metrics)",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        default=None,
+        metavar="[HOST:]PORT",
+        help="Serve Prometheus metrics (consensus and execution client "
+        + "events, attestations, duty failures, consensus times and "
+        + "validator counts) on http://HOST:PORT/metrics, HOST defaults to "
+        + "127.0.0.1. Use --output none to only collect metrics, disables --jobs",
+    )
+
     parser.add_argument(
         "-t",
         "--traceback",
@@ -82,240 +143,536 @@ def parse_args() -> Any:
         action="store_true",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "-f",
+        "--follow",
+        default=False,
+        help="Keep reading the log file as it grows, following it across "
+        + "rotation and truncation",
+        action="store_true",
+    )
 
-    return args
+    parser.add_argument(
+        "--source",
+        action="append",
+        dest="sources",
+        type=lambda spec: (spec, "file"),
+        metavar="[NAME=]PATH",
+        help="Follow a log file or read a FIFO, tagging its logs with NAME "
+        + "(the file name by default), can be given more than once",
+    )
 
+    parser.add_argument(
+        "--listen",
+        action="append",
+        metavar="[tcp://|udp://][HOST]:PORT",
+        help="Receive logs over the network, newline delimited logs or "
+        + "syslog over TCP and syslog over UDP, tagging them with the "
+        + "sending host, can be given more than once",
+    )
 
-def cleanup_log(line: str) -> list[str] | None:
-    log = line.strip().replace("        ", "\t").split("\t")
+    parser.add_argument(
+        "--command",
+        action="append",
+        dest="sources",
+        type=lambda spec: (spec, "command"),
+        metavar="[NAME=]COMMAND",
+        help="Run a command such as 'docker logs -f ssv1' and read its "
+        + "output, tagging its logs with NAME (the last argument by "
+        + "default), can be given more than once",
+    )
 
-    if "systemd[1]" in line:  # Ignore systemd messages
-        return None
+    parser.add_argument(
+        "--since",
+        type=parse_time,
+        metavar="TIME",
+        help="Only show logs from this time on, e.g. 2024-05-01T10:00 (UTC, "
+        + "like the logs) or 2024-05-01T12:00+02:00, found without reading "
+        + "the file up to it",
+    )
 
-    if len(log) < 2:  # Ignore any non standard messages
-        return None
+    parser.add_argument(
+        "--until",
+        type=parse_time,
+        metavar="TIME",
+        help="Only show logs from before this time",
+    )
+
+    parser.add_argument(
+        "--level",
+        type=str.upper,
+        choices=LEVELS,
+        help="Only show logs of this level or above",
+    )
+
+    parser.add_argument(
+        "--component",
+        action="append",
+        dest="components",
+        metavar="NAME",
+        help="Only show logs of this component (e.g. P2PNetwork), "
+        + "can be given more than once",
+    )
+
+    parser.add_argument(
+        "--index",
+        default=False,
+        help="Keep an index of the log file next to it (FILE.ssvidx) so that "
+        + "later runs with --since, --until, --level or --component only "
+        + "read the parts of the file they show",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--summary",
+        default=False,
+        help="Print a status line with consensus time quantiles and "
+        + "successful and failed duties per role every epoch, disables --jobs",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--summary-interval",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Print the --summary status line every SECONDS of log time "
+        + "instead of every epoch",
+    )
+
+    parser.add_argument(
+        "--dedup",
+        default=False,
+        help="Collapse messages repeated within --dedup-window seconds into "
+        + "a 'last message repeated N times' line, disables --jobs",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--dedup-window",
+        type=float,
+        default=WINDOW,
+        metavar="SECONDS",
+        help=f"Seconds of log time repeats are collapsed for (default {WINDOW:g})",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Number of processes used to read large log files, "
+        + "defaults to one per CPU core. Logs read from stdin are rendered "
+        + "by N processes only when this is given",
+    )
+
+    parser.add_argument(
+        "--profile",
+        default=False,
+        help="Print the time spent in each matcher on exit or on SIGUSR1, "
+        + "disables --jobs",
+        action="store_true",
+    )
+
+    args = parser.parse_args(argv)
+
+    # Modules of optional features are only imported when they are used, to
+    # keep startup fast for short runs
+
+    args.log_file = None
+    if args.log_files:
+        from ssvlogger.merge import expand_paths, is_compressed
+
+        try:
+            args.log_files = expand_paths(args.log_files)
+        except FileNotFoundError as error:
+            parser.error(str(error))
+
+        # A single uncompressed file, which can be followed or read in parallel
+        if len(args.log_files) == 1 and not is_compressed(args.log_files[0]):
+            args.log_file = args.log_files[0]
+
+    if args.follow and args.log_file is None:
+        parser.error("--follow requires a single uncompressed log file")
+
+    if args.sources and args.log_files:
+        parser.error("--source and --command can not be combined with log files")
+
+    if args.listen and (args.log_files or args.sources):
+        parser.error("--listen can not be combined with log files or sources")
+
+    if args.input is None:
+        if args.journal:
+            args.input = "journal"
+        else:
+            args.input = "docker" if args.sources or args.listen else "auto"
+
+    if args.input == "auto":
+        if args.sources or args.listen:
+            parser.error("--input auto reads stdin or log files")
+        if args.log_files:  # Files are read as the first one is
+            args.input = file_format(args.log_files[0]) or "json"
+    args.journal = args.input == "journal"
+
+    if args.follow and args.input == "journal-export":
+        parser.error("--follow does not support --input journal-export")
+
+    if args.sources and args.input in JOURNAL_FORMATS:
+        parser.error("--source and --command read docker, journal or json logs")
+
+    if args.listen and args.input != "docker":
+        parser.error("--listen reads docker or json logs, telling them apart by line")
+
+    if (args.since or args.until or args.index) and (
+        args.log_file is None or args.follow or args.input in JOURNAL_FORMATS
+    ):
+        parser.error(
+            "--since, --until and --index require a single log file, without --follow"
+        )
+
+    if args.output != "text" and (args.summary or args.dedup):
+        parser.error("--summary and --dedup require --output text")
+
+    try:
+        if args.sources:
+            from ssvlogger.sources import parse_source
+
+            args.sources = [parse_source(spec, kind) for spec, kind in args.sources]
+        if args.listen:
+            from ssvlogger.listen import parse_address
+
+            args.listen = [parse_address(spec) for spec in args.listen]
+        if args.metrics is not None:
+            from ssvlogger.metrics import parse_endpoint
+
+            args.metrics = parse_endpoint(args.metrics)
+    except ValueError as error:
+        parser.error(str(error))
+
+    args.levels = set(LEVELS[LEVELS.index(args.level) :]) if args.level else None
+    if args.components is not None:
+        args.components = set(args.components)
+
+    args.profiler = Profiler() if args.profile else None
+    args.parser = Parser(
+        verbose=args.verbose,
+        silent=args.silent,
+        traceback=args.traceback,
+        journal=args.journal,
+        levels=args.levels,
+        components=args.components,
+        profiler=args.profiler,
+        key_fields=args.output == "json",
+    )
+    args.summarizer = args.deduper = args.collector = None
+    if args.summary:
+        from ssvlogger.summary import Summary
+
+        args.summarizer = Summary(args.summary_interval)
+    if args.dedup:
+        args.deduper = Deduplicator(args.dedup_window)
+    if args.metrics is not None:
+        from ssvlogger.metrics import Metrics
+
+        args.collector = Metrics()
+
+    # Lines are only dropped before they are parsed when no log that is not
+    # shown is counted, so the metrics and summary do not depend on -v and -s
+    args.prefilter = args.collector is None and args.summarizer is None
+
+    return args
+
+
+def render_json(record: LogRecord, args: Any) -> list[str]:
+    """Renders a log record as one JSON object"""
+
+    if not args.parser.accepts(record):
+        return []
+    if (event := args.parser.parse(record)) is None:
+        return []
+    return [dumps(event.to_dict())]
 
-    return log
 
+def render_text(record: LogRecord, args: Any) -> list[str]:
+    """Renders a log record as the text lines to print for it"""
 
-def process_log(line: str, args: Any):
-    log = cleanup_log(line)
-    if log is None:
-        return
+    if not args.parser.accepts(record):
+        return []
 
     # Time and information recovery
-    time, stat = extract_time_and_stat(log, not args.journal)
+    time, stat = extract_time_and_stat(record, not args.journal)
+
+    lines = []
 
     if "DEBUG" in stat and args.verbose:
-        tolog = tolog = "        ".join(log[2:])
-        print(f"{time} {stat}: {tolog[2:]}")
+        tolog = record.text()
+        lines.append(f"{time} {stat}: {tolog[2:]}")
     elif "DEBUG" in stat:
-        return
+        return lines
+
+    if (event := args.parser.render(record)) is None:
+        return lines
+    tolog = event.message
+
+    if args.deduper is not None:
+        show, notices = args.deduper.check(record, f"{time} {stat}: ", tolog)
+        if not show:  # Drop the verbose debug line of the repeat too
+            lines.clear()
+        lines.extend(notices)
+        if not show:
+            return lines
+
+    lines.append(f"{time} {stat}: {tolog}")
+
+    for i in event.details:
+        lines.append(f"{time} {stat}: {i}")
+
+    return lines
+
+
+# Renderers of a log record, by --output
+OUTPUTS: dict[str, Callable[[LogRecord, Any], list[str]]] = {
+    "text": render_text,
+    "json": render_json,
+    "none": lambda record, args: [],
+}
+
+
+def process_log(record: LogRecord | None, args: Any) -> list[str]:
+    """Renders a log record into the lines to print for it"""
+
+    if record is None:
+        return []
+
+    if args.collector is not None:
+        args.collector.observe(record)
+
+    # Fed every log, not only the ones shown
+    status = None
+    if args.summarizer is not None:
+        time, _ = extract_time_and_stat(record, not args.journal)
+        status = args.summarizer.observe(record, time)
+
+    lines = OUTPUTS[args.output](record, args)
+    return [status, *lines] if status else lines
+
+
+def render_line(line: str, args: Any) -> list[str]:
+    """Renders a line as printed by docker or journalctl"""
+
+    if not args.prefilter or keep_line(line, args):
+        return process_log(parse_line(line), args)
+    return []
+
+
+def render_json_line(line: str, args: Any) -> list[str]:
+    """Renders a line of the node's JSON log file"""
+
+    if line and (not args.prefilter or keep_json(line, args)):
+        return process_log(parse_json(line), args)
+    return []
+
+
+def render_journal_entry(entry: dict[str, Any], args: Any) -> list[str]:
+    """Renders an entry of `journalctl -o json` or `journalctl -o export`"""
+
+    if journal.is_systemd(entry) or (line := journal.message(entry)) is None:
+        return []
+
+    keep = keep_json if line.startswith("{") else keep_line
+    if not args.prefilter or keep(line, args):
+        return process_log(journal.parse_entry(entry, line), args)
+    return []
 
-    additional_logs = []
-    tolog = ""
+
+# Renderers of the line based formats, by --input
+RENDERERS = {
+    "docker": render_line,
+    "journal": render_line,
+    "json": render_json_line,
+}
+
+
+def journal_entries(
+    args: Any, chunks: Iterator[list[str]] | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yields the journal entries read from the log file, or from the lists
+    of lines read from stdin"""
+
+    if args.input == "journal-export":
+        if args.log_file is None:
+            yield from journal.export_entries(sys.stdin.buffer)
+        else:
+            with open(args.log_file, "rb") as inp:
+                yield from journal.export_entries(inp)
+    elif args.follow:
+        from ssvlogger.follow import follow
+
+        yield from journal.json_entries(follow(args.log_file))
+    elif args.log_file is None:
+        yield from journal.json_entries(line for lines in chunks for line in lines)
+    else:
+        with open(args.log_file, "rb", buffering=0) as inp:
+            yield from journal.json_entries(iter_lines(inp))
+
+
+def file_format(path: str) -> str | None:
+    """Detects the format of a log file from its first lines"""
+
+    from ssvlogger.merge import open_source
 
     try:
-        x = switch_log(log, stat, args)
-        if x is None:
-            return
-        (tolog, additional_logs) = x
-    except json.decoder.JSONDecodeError:
-        tolog = "        ".join(log[2:])
-    except IndexError:
-        tolog = "        ".join(log[2:])
-    except KeyError:
-        tolog = "        ".join(log[2:])
-
-    # Print log to stdout
-    print(f"{time} {stat}: {tolog}")
-
-    # Print and reset additional logs
-    for i in additional_logs:
-        print(f"{time} {stat}: {i}")
-
-
-def switch_log(log: list[str], stat: Any, args: Any) -> tuple[str, list[str]] | None:
-    # P2P network
-    additional_logs = []
-    tolog = ""
-
-    if log[2].replace(".", "_") in dir(matches):
-
-        module: dict[
-            str, tuple[Callable[[list[str]]], tuple[str, list[str]] | None]
-        ] = getattr(matches, log[2].replace(".", "_"))
-
-        for k, (f, silent) in module.items():
-            if k in log[3]:
-                log = f(log)
-                if (args.silent and silent) or (log is None):
-                    return None
-                tolog, additional_logs = log
-                break
-
-        if tolog == "":
-            tolog = "        ".join(log[2:])
-
-    # Edge case logs that don't belong to a specific module
-
-    elif log[2] == "Observability" and log[3] == "global logger initialized":
-        tolog = "SSV logger initialized"
-    elif (
-        log[2] == "Observability"
-        or log[2] == "MetricsHandler"
-        or log[2] == "Migrations"
-        or log[2] == "starting event listener"
-        or log[2] == "getting operator private key from keystore"
-        or log[2] == "using badger db"
-    ):
+        with open_source(path) as stream:
+            return detect_format(iter_line_chunks(stream, DETECT_SIZE))[0]
+    except OSError:  # Left to be reported when the file is read
         return None
 
-    elif len(log) == 4 and len(json.loads(log[3]).keys()) == 3:
-        tolog = log[2]
 
-    elif log[2] == "found network config by name":
-        data = json.loads(log[3])
-        tolog = (
-            f"Loading {colorama.Fore.LIGHTMAGENTA_EX}"
-            + f"{data['name']}{colorama.Fore.RESET} network config"
+def detect_input(args: Any, chunks: Iterator[list[str]]) -> Iterator[list[str]]:
+    """Detects the format of stdin from its first lines, which are read as
+    lists of lines. The detected format is used for the rest of the stream,
+    replacing a format that was given (with a warning) if the lines are in
+    another one, and --input auto falls back to docker."""
+
+    fmt, chunks = detect_format(chunks)
+    if args.input == "auto":
+        args.input = fmt or "docker"
+    elif fmt is not None and fmt != args.input:
+        print(
+            f"SSVLogger: the logs look like --input {fmt}, not {args.input}, "
+            + f"reading them as {fmt}",
+            file=sys.stderr,
         )
+        args.input = fmt
+    args.journal = args.parser.journal = args.input == "journal"
+    return chunks
 
-    elif log[2] == "setting ssv network":
-        data = json.loads(log[3])
-        if (config := data.get("config")) is not None:
-            name = json.loads(config)["name"]
-        else:
-            name = data.get("network") or "unknown"
-        tolog = (
-            f"Configuring SSV node for running on {colorama.Fore.MAGENTA}"
-            + f"{name}{colorama.Fore.RESET}"
-        )
 
-    elif log[2] == "consensus client: connecting":
-        data = json.loads(log[3])
-        tolog = (
-            f"Connecting to consensus clients {colorama.Fore.MAGENTA}"
-            + f"{data['address']}{colorama.Fore.RESET}"
-        )
+def file_spans(args: Any) -> list[tuple[int, int]]:
+    """Returns the (start, end) ranges of the log file that can hold logs
+    shown with the given filters"""
 
-    elif log[2] == "consensus client: connecting (multi client)":
-        data = json.loads(log[3])
-        tolog = "Connecting to the following consensus clients:"
-        additional_logs = []
-        for address in data["addresses"]:
-            additional_logs.append(
-                f" - {colorama.Fore.MAGENTA}" + f"{address}{colorama.Fore.RESET}"
-            )
-
-    elif log[2] == "applying migrations" or log[3] == "applying migrations":
-        data = json.loads(log[4] or log[3])
-        tolog = (
-            f"Applying {colorama.Fore.LIGHTBLUE_EX}{data['count']}"
-            + f"{colorama.Fore.RESET} migrations"
-        )
+    span = time_range(args.log_file, args.input, args.since, args.until)
+    if not args.index:
+        return [span]
 
-    elif (
-        log[2] == "applied migrations successfully"
-        or log[3] == "applied migrations successfully"
-    ):
-        tolog = "Applied migrations sucessfully"
+    levels, components = args.levels, args.components
+    if not args.prefilter:  # Every log in the time range is counted
+        levels = components = None
+    elif not args.verbose:  # Debug logs are only printed in verbose mode
+        levels = (levels or set(LEVELS)) - {"DEBUG"}
 
-    elif log[2] == "successfully loaded operator keys":
-        data = json.loads(log[3])
-        tolog = (
-            f"Loaded operator key ({colorama.Fore.MAGENTA}{data['pubkey'][16:]}"
-            + f"{colorama.Fore.RESET})"
-        )
+    from ssvlogger.index import load_index, select_spans
 
-    elif log[2] == "historical registry sync stats":
-        data = json.loads(log[3])
-        tolog = "Network statistics: "
-        additional_logs.append(f"Operator ID           : {data['my_operator_id']}")
-        additional_logs.append(f"Operators on network  : {data['operators']}")
-        additional_logs.append(f"Validators on network : {data['validators']}")
-        additional_logs.append(
-            f"Liquidated Validators : {data['liquidated_validators']}"
-        )
-        additional_logs.append(f"Validators managed    : {data['my_validators']}")
-
-    elif log[2] == "increasing MaxPeers to match the operator's subscribed subnets":
-        data = json.loads(log[3])
-        tolog = (
-            f"Increasing max peers from {colorama.Fore.LIGHTCYAN_EX}{data['old_max_peers']}"
-            + f"{colorama.Fore.RESET} to {colorama.Fore.LIGHTCYAN_EX}"
-            + f"{data['new_max_peers']}{colorama.Fore.RESET}"
-        )
+    filters = argparse.Namespace(
+        since=args.since, until=args.until, levels=levels, components=components
+    )
+    return select_spans(load_index(args.log_file, args.input), span, filters)
 
-    elif "OPERATOR SUCCESSFULLY CONFIGURED" in log[3]:
-        tolog = "Operator configured sucessfully"
 
-        additional_logs.append(
-            f"{colorama.Fore.GREEN}"
-            + f"╔═╗╔╦╗╔═╗╦═╗╔╦╗╦ ╦╔═╗  ╔═╗╦ ╦╔═╗╔═╗╔═╗╔═╗╔═╗{colorama.Fore.RESET}"
-        )
-        additional_logs.append(
-            f"{colorama.Fore.GREEN}"
-            + f"╚═╗ ║ ╠═╣╠╦╝ ║ ║ ║╠═╝  ╚═╗║ ║║  ║  ║╣ ╚═╗╚═╗{colorama.Fore.RESET}"
-        )
-        additional_logs.append(
-            f"{colorama.Fore.GREEN}"
-            + f"╚═╝ ╩ ╩ ╩╩╚═ ╩ ╚═╝╩    ╚═╝╚═╝╚═╝╚═╝╚═╝╚═╝╚═╝{colorama.Fore.RESET}"
-        )
+def render_merged(args: Any, out: BufferedWriter):
+    """Renders several or compressed log files, merged in timestamp order
+    and tagged with the file each line came from"""
 
-    # Specific Error Handling
-
-    elif "node is not healthy" in log[2]:
-        data = json.loads(log[3])
-        node = data["node"]
-        error = data["error"].replace('\\"', '"')
-        tolog = f"Issue with {node} {colorama.Fore.RED}{error}"
-        if args.traceback:
-            verbose = (
-                data["errorVerbose"]
-                .replace('\\"', '"')
-                .replace("\\n", "\n")
-                .replace("\\r", "\r")
-                .replace("\\t", "\t")
-            )
-            tolog += f"\nFull Traceback:\n{verbose}"
-        tolog += colorama.Fore.RESET
-
-    elif "not all nodes are healthy" in log[2]:
-        tolog = "not all nodes are healthy"
-    elif (
-        "ethereum node(s) are either out of sync or down. Ensure the nodes are healthy to resume."
-        in log[2]
-    ):
-        tolog = (
-            "ethereum node(s) are either out "
-            + "of sync or down. Ensure the nodes are healthy to resume."
-        )
+    if args.input in JOURNAL_FORMATS:
+        render = render_journal_entry
+    else:
+        render = RENDERERS[args.input]
 
-    # Generic Error handling and fallback
+    if len(args.log_files) > 1:
+        tags = source_tags([os.path.basename(path) for path in args.log_files], args)
     else:
-        if "ERROR" in stat or "FATAL" in stat:
-            try:
-                data = json.loads(log[3])
-                tolog = f"{log[2]} - {data['error']}"
-                if args.traceback and "errorVerbose" in data.keys():
-                    verbose = (
-                        data["errorVerbose"]
-                        .replace('\\"', '"')
-                        .replace("\\n", "\n")
-                        .replace("\\r", "\r")
-                        .replace("\\t", "\t")
-                    )
-                    tolog += f"\nFull Traceback:\n{verbose}"
-            except IndexError:
-                tolog = f"{log[2]}"
-            except json.decoder.JSONDecodeError:
-                tolog = f"{log[2]} - {log[3]}"
-        else:
-            tolog = "        ".join(log[2:])
+        tags = None
+
+    from ssvlogger.merge import merge_sources
+
+    for index, item in merge_sources(args.log_files, args.input):
+        if lines := render(item, args):
+            if tags is not None:
+                lines = tag_lines(tags[index], lines, args)
+            out.write_lines(lines)
+
+
+def render_sources(args: Any, out: BufferedWriter):
+    """Renders the logs of --source and --command as they arrive, tagged
+    with the name of their source"""
+
+    import asyncio
+    from ssvlogger.sources import interleave
+
+    render = RENDERERS[args.input]
+    tags = source_tags([name for name, _, _ in args.sources], args)
+
+    async def run():
+        async for index, batch in interleave(args.sources):
+            lines = []
+            for line in batch:
+                lines.extend(render(line, args))
+            if lines:
+                out.write_lines(tag_lines(tags[index], lines, args))
+
+    asyncio.run(run())
+
+
+def render_listen(args: Any, out: BufferedWriter):
+    """Renders the logs received with --listen, tagged with their sender"""
+
+    import asyncio
+    from ssvlogger.listen import receive
+
+    tags: dict[str, str] = {}
+
+    async def run():
+        async for batch in receive(args.listen):
+            lines = []
+            for peer, line in batch:
+                render = render_json_line if line.startswith("{") else render_line
+                if rendered := render(line, args):
+                    if (tag := tags.get(peer)) is None:
+                        if len(tags) >= TAG_CACHE_SIZE:
+                            tags.clear()
+                        tag = tags[peer] = source_tags([peer], args)[0]
+                    lines.extend(tag_lines(tag, rendered, args))
+            if lines:
+                out.write_lines(lines)
+
+    asyncio.run(run())
+
+
+def source_tags(names: list[str], args: Any) -> list[str]:
+    """Returns the tag of each source, its coloured name or for --output
+    json the start of an object with a source key"""
+
+    if args.output == "json":
+        return ['{"source":' + dumps(name) + "," for name in names]
+    return [SOURCE_TAG.format(name=name) for name in names]
+
+
+def tag_lines(tag: str, lines: list[str], args: Any) -> list[str]:
+    if args.output == "json":  # The source becomes the first key
+        return [tag + line[1:] for line in lines]
+    return [tag + line for line in lines]
+
+
+def write_rendered(items: Iterable[Any], render: Callable, args: Any, out: BufferedWriter):
+    """Renders lines or journal entries one at a time, writing the lines of
+    each as it is rendered"""
+
+    for item in items:
+        if lines := render(item, args):
+            out.write_lines(lines)
 
-    return tolog, additional_logs  # type: ignore
+
+def stateful(args: Any) -> bool:
+    """Whether logs have to be rendered in this process, as the options
+    used keep their state here"""
+
+    return (
+        args.profile
+        or args.summarizer is not None
+        or args.deduper is not None
+        or args.collector is not None
+    )
 
 
 def main():
@@ -327,34 +684,94 @@ def main():
         print("\nExiting...")
         sys.exit(0)
     except Exception as error:
-        print(f"{colorama.Fore.RED}SSVLogger Error: {error}{colorama.Fore.RESET}")
+        print(f"{Fore.RED}SSVLogger Error: {error}{Fore.RESET}")
         sys.exit(1)
 
 
 def main_function():
     """Main function"""
 
-    colorama.init()
     args = parse_args()
+    if (
+        args.output == "text"
+        and sys.stdout.isatty()
+        and not os.environ.get("NO_COLOR")
+    ):
+        import colorama
 
-    if args.log_file is not None:
-        inp = open(args.log_file, "r", encoding="utf-8")
-        while (line := inp.readline()) != "":
-            line = json.loads(line)
-            if "N" in line.keys():
-                line = "        ".join(
-                    [line["T"], line["L"], line["N"], line["M"], json.dumps(line)]
-                )
-            else:
-                line = "        ".join(
-                    [line["T"], line["L"], line["M"], json.dumps(line)]
-                )
+        colorama.init()
+        use_renderer(True)
+    else:  # Nothing to colour, skip the codes and colorama's wrapper
+        use_renderer(False)
+
+    if args.collector is not None:
+        from ssvlogger.metrics import serve
 
-            process_log(line, args)
+        serve(args.collector, *args.metrics)
 
+    if args.profiler is not None and hasattr(signal, "SIGUSR1"):
+        signal.signal(
+            signal.SIGUSR1, lambda *_: args.profiler.report(sys.stderr)
+        )
+
+    if args.log_files and not args.follow:
+        out = BufferedWriter(sys.stdout, idle=None)
     else:
-        for line in sys.stdin:
-            process_log(line, args)
+        out = BufferedWriter(sys.stdout)
+
+    try:
+        chunks = None
+        if not (args.listen or args.sources or args.log_files):
+            if args.input != "journal-export":  # Read by journal.export_entries
+                chunks = detect_input(args, iter_line_chunks(sys.stdin.buffer.raw))
+
+        render = RENDERERS.get(args.input)
+
+        if args.listen:
+            render_listen(args, out)
+
+        elif args.sources:
+            render_sources(args, out)
+
+        elif args.log_files and args.log_file is None:
+            render_merged(args, out)
+
+        elif args.input in JOURNAL_FORMATS:
+            write_rendered(journal_entries(args, chunks), render_journal_entry, args, out)
+
+        elif args.follow:
+            from ssvlogger.follow import follow
+
+            write_rendered(follow(args.log_file), render, args, out)
+
+        elif args.log_file is not None:
+            from ssvlogger.parallel import render_file, use_parallel
+
+            spans = file_spans(args)
+            jobs = 1 if stateful(args) else args.jobs or os.cpu_count() or 1
+            if use_parallel(spans, jobs):
+                for lines in render_file(args.log_file, render, args, jobs, spans):
+                    out.write_lines(lines)
+            else:
+                for span in spans:
+                    write_rendered(iter_file_lines(args.log_file, *span), render, args, out)
+
+        elif args.jobs > 1 and not stateful(args):
+            from ssvlogger.parallel import render_stream
+
+            for lines in render_stream(chunks, render, args, args.jobs):
+                out.write_lines(lines)
+
+        else:
+            write_rendered(itertools.chain.from_iterable(chunks), render, args, out)
+    finally:
+        if args.deduper is not None:
+            out.write_lines(args.deduper.flush())
+        if args.summarizer is not None and (status := args.summarizer.flush()):
+            out.write(status)
+        out.close()
+        if args.profiler is not None:
+            args.profiler.report(sys.stderr)
 
 
 if __name__ == "__main__":
@@ -1,32 +1,43 @@
-# pylint: disable=C0116, C0114
-
-from ssvlogger.matches.p2pnetwork import P2PNetwork
-from ssvlogger.matches.p2pnetwork_conn_handler import P2PNetwork_ConnHandler
-from ssvlogger.matches.consensus import ConsensusClient
-from ssvlogger.matches.controller_commitee import Controller_Committee
-from ssvlogger.matches.controller_validator import Controller_Validator
-from ssvlogger.matches.controller import Controller
-from ssvlogger.matches.duty_scheduler import DutyScheduler
-from ssvlogger.matches.execution_client import ExecutionClient
-from ssvlogger.matches.event_handler import EventHandler
-from ssvlogger.matches.event_syncer import EventSyncer
-
-Operator_DutyScheduler = DutyScheduler
-consensus_client = ConsensusClient
-execution_client = ExecutionClient
-
-__all__ = [
-    "P2PNetwork",
-    "P2PNetwork_ConnHandler",
-    "ConsensusClient",
-    "consensus_client",
-    "execution_client",
-    "Controller_Committee",
-    "Controller_Validator",
-    "Controller",
-    "DutyScheduler",
-    "Operator_DutyScheduler",
-    "ExecutionClient",
-    "EventHandler",
-    "EventSyncer",
-]
+# pylint: disable=C0116, C0114, E0603
+
+import importlib
+from typing import Any
+
+# Matcher tables by component, with the module they are defined in. Each
+# module is only imported once its table is first used (PEP 562), so only
+# the components that appear in the logs are loaded.
+TABLES = {
+    "P2PNetwork": ("p2pnetwork", "P2PNetwork"),
+    "P2PNetwork_ConnHandler": ("p2pnetwork_conn_handler", "P2PNetwork_ConnHandler"),
+    "ConsensusClient": ("consensus", "ConsensusClient"),
+    "consensus_client": ("consensus", "ConsensusClient"),
+    "execution_client": ("execution_client", "ExecutionClient"),
+    "Controller_Committee": ("controller_commitee", "Controller_Committee"),
+    "Controller_Validator": ("controller_validator", "Controller_Validator"),
+    "Controller": ("controller", "Controller"),
+    "DutyScheduler": ("duty_scheduler", "DutyScheduler"),
+    "Operator_DutyScheduler": ("duty_scheduler", "DutyScheduler"),
+    "ExecutionClient": ("execution_client", "ExecutionClient"),
+    "EventHandler": ("event_handler", "EventHandler"),
+    "EventSyncer": ("event_syncer", "EventSyncer"),
+}
+
+__all__ = list(TABLES)
+
+
+def load(name: str) -> dict[str, Any]:
+    """Imports the module of a matcher table and returns the table"""
+
+    module, table = TABLES[name]
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), table)
+    # Importing execution_client set it to the module, the name stays the table
+    for alias, entry in TABLES.items():
+        if entry == (module, table):
+            globals()[alias] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return load(name)
@@ -1,126 +1,119 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
-
-
-def slot_cache_updated(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Updated block root and slot cache to slot {colorama.Fore.LIGHTCYAN_EX}"
-        + f"{data['slot']}{colorama.Fore.RESET} at {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"0x{data['block_root'][0:4]}..{data['block_root'][-4:]}{colorama.Fore.RESET}"
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
+
+SLOT_CACHE_UPDATED = template(
+    "Updated block root and slot cache to slot {LIGHTCYAN_EX}{slot}{RESET}"
+    + " at {LIGHTMAGENTA_EX}0x{root_start}..{root_end}{RESET}"
+)
+EVENT_RECEIVED = template("Received {GREEN}{topic}{RESET} event from CL")
+EVENT_BROADCASTED = template(
+    "Broadcasted {GREEN}{topic}{RESET} event to {LIGHTCYAN_EX}{subscriber}{RESET}"
+)
+SUBMITTED_REGISTRATIONS = template(
+    "Submitted {MAGENTA}{count}{RESET} validator registrations"
+)
+RETURNED_ERROR = template(
+    "Unable to communicate with consensus client ({address}): {RED}{error}{RESET}"
+)
+DISCONNECTED = template("Consensus client {RED}{address}{RESET} offline")
+OUT_OF_SYNC = template(
+    "Consensus client {RED}{address}{RESET} out of sync with the main chain"
+)
+IN_SYNC = template(
+    "Consensus client {GREEN}{address}{RESET} resynced with the main chain"
+)
+CONNECTED = template(
+    "Connected to {LIGHTCYAN_EX}{client}-{version}{RESET} consensus client"
+    + " at {MAGENTA}{address}{RESET}"
+)
+SUBSCRIBING = template("Subscribing to CL events {LIGHTCYAN_EX}{topics}{RESET}")
+FORK_EPOCH = template(" - {LIGHTCYAN_EX}{name}{RESET}: {GREEN}{epoch}{RESET}")
+ALL_CLIENTS_FAILED = template("{RED}All CL clients failed to submit block{RESET}")
+
+
+def slot_cache_updated(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return SLOT_CACHE_UPDATED.format(
+        slot=data["slot"],
+        root_start=data["block_root"][0:4],
+        root_end=data["block_root"][-4:],
     ), []
 
 
-def event_received(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Received {colorama.Fore.GREEN}"
-        + f"{data['topic']}{colorama.Fore.RESET} event from CL"
-    ), []
+def event_received(record: LogRecord) -> tuple[str, list[str]] | None:
+    return EVENT_RECEIVED.format(topic=record.fields["topic"]), []
 
 
-def event_broadcasted(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Broadcasted {colorama.Fore.GREEN}"
-        + f"{data['topic']}{colorama.Fore.RESET} event to "
-        + f"{colorama.Fore.LIGHTCYAN_EX}{data['subscriber_identifier']}{colorama.Fore.RESET}"
+def event_broadcasted(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return EVENT_BROADCASTED.format(
+        topic=data["topic"], subscriber=data["subscriber_identifier"]
     ), []
 
 
-def submitted_registrations(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Submitted {colorama.Fore.MAGENTA}{data['count']}{colorama.Fore.RESET}"
-        + " validator registrations"
-    ), []
+def submitted_registrations(record: LogRecord) -> tuple[str, list[str]] | None:
+    return SUBMITTED_REGISTRATIONS.format(count=record.fields["count"]), []
 
 
-def returned_error(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        "Unable to communicate with consensus client "
-        + f"({data.get('address') or data.get('client_addr') or 'default'}): {colorama.Fore.RED}"
-        + f"{data['error']}{colorama.Fore.RESET}"
+def returned_error(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return RETURNED_ERROR.format(
+        address=data.get("address") or data.get("client_addr") or "default",
+        error=data["error"],
     ), []
 
 
-def disconnected(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Consensus client {colorama.Fore.RED}"
-        + f"{data['address']}{colorama.Fore.RESET} offline"
-    ), []
+def disconnected(record: LogRecord) -> tuple[str, list[str]] | None:
+    return DISCONNECTED.format(address=record.fields["address"]), []
 
 
-def out_of_sync(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Consensus client {colorama.Fore.RED}"
-        + f"{data['address']}{colorama.Fore.RESET} out of sync with the main chain"
-    ), []
+def out_of_sync(record: LogRecord) -> tuple[str, list[str]] | None:
+    return OUT_OF_SYNC.format(address=record.fields["address"]), []
 
 
-def in_sync(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Consensus client {colorama.Fore.GREEN}"
-        + f"{data['address']}{colorama.Fore.RESET} resynced with the main chain"
-    ), []
+def in_sync(record: LogRecord) -> tuple[str, list[str]] | None:
+    return IN_SYNC.format(address=record.fields["address"]), []
 
 
-def connected(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Connected to {colorama.Fore.LIGHTCYAN_EX}{data['client']}"
-        + f"-{data['version']}{colorama.Fore.RESET} consensus client at {colorama.Fore.MAGENTA}"
-        + f"{data['address']}{colorama.Fore.RESET}"
+def connected(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return CONNECTED.format(
+        client=data["client"], version=data["version"], address=data["address"]
     ), []
 
 
-def noop(_log: list[str]) -> tuple[str, list[str]] | None:
+def noop(_record: LogRecord) -> tuple[str, list[str]] | None:
     return None
 
 
-def subscribing(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Subscribing to CL events {colorama.Fore.LIGHTCYAN_EX}"
-        + f"{data['topics']}{colorama.Fore.RESET}"
-    ), []
+def subscribing(record: LogRecord) -> tuple[str, list[str]] | None:
+    return SUBSCRIBING.format(topics=record.fields["topics"]), []
 
 
-def adding_event_subscriber(log: list[str]) -> tuple[str, list[str]] | None:
-    return log[3] + " to consensus client", []
+def adding_event_subscriber(record: LogRecord) -> tuple[str, list[str]] | None:
+    return record.message + " to consensus client", []
 
 
-def optimistic(_log: list[str]) -> tuple[str, list[str]] | None:
+def optimistic(_record: LogRecord) -> tuple[str, list[str]] | None:
     return "Consensus client is in optimistic mode", []
 
 
-def fork_epochs(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
+def fork_epochs(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
     out = []
 
     for name, epoch in data.items():
         if name in ["current_data_version", "node_addr", "L", "T", "N", "M"]:
             continue
-        out.append(
-            f" - {colorama.Fore.LIGHTCYAN_EX}{name}{colorama.Fore.RESET}"
-            + f": {colorama.Fore.GREEN}{epoch}{colorama.Fore.RESET}"
-        )
+        out.append(FORK_EPOCH.format(name=name, epoch=epoch))
 
     return "Retrieved fork epochs from CL", out
 
 
-def all_clients_failed_to_submit(_log: list[str]) -> tuple[str, list[str]] | None:
-    return (
-        f"{colorama.Fore.RED}All CL clients failed to submit block"
-        + f"{colorama.Fore.RESET}",
-        [],
-    )
+def all_clients_failed_to_submit(_record: LogRecord) -> tuple[str, list[str]] | None:
+    return ALL_CLIENTS_FAILED.format(), []
 
 
 ConsensusClient = {
@@ -1,61 +1,55 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
 
+STATUS_RECORDING = template(
+    "{LIGHTCYAN_EX}{count}{RESET} validators {LIGHTMAGENTA_EX}{status}{RESET}"
+)
+INITIALIZING = template("Configuring {YELLOW}{count}{RESET} validators")
+SKIPPING = template(
+    "Skipping setup for validator {RED}0x{pubkey}{RESET}"
+    + " until it becomes active on beacon chain"
+)
+MISSING_METADATA = template(
+    "Unable to initialize {RED}{count}{RESET} validator{plural}"
+    + " due to missing metadata or non-active status on beacon chain"
+)
+FAILED = template("Failed to initialize {RED}{count}{RESET} validator{plural}")
+INITIALIZED = template("Initialized {GREEN}{count}{RESET} validator{plural}")
+COMPLETED = template("Completed initialization for {MAGENTA}{count}{RESET} validators")
 
-def validator_status_recording(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"{colorama.Fore.LIGHTCYAN_EX}{data['count']}{colorama.Fore.RESET} validators "
-        + f"{colorama.Fore.LIGHTMAGENTA_EX}{data['status']}{colorama.Fore.RESET}"
-    ), []
 
+def validator_status_recording(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return STATUS_RECORDING.format(count=data["count"], status=data["status"]), []
 
-def initializing_validators(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Configuring {colorama.Fore.YELLOW}{data['shares count']}"
-        + f"{colorama.Fore.RESET} validators"
-    ), []
 
+def initializing_validators(record: LogRecord) -> tuple[str, list[str]] | None:
+    return INITIALIZING.format(count=record.fields["shares count"]), []
 
-def skipping_validator(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Skipping setup for validator {colorama.Fore.RED}0x{data['pubkey'][:8]}"
-        + f"{colorama.Fore.RESET} until it becomes active on beacon chain"
-    ), []
 
+def skipping_validator(record: LogRecord) -> tuple[str, list[str]] | None:
+    return SKIPPING.format(pubkey=record.fields["pubkey"][:8]), []
 
-def init_validators(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    additional_logs = []
-
-    additional_logs.append(
-        f"Unable to initialize {colorama.Fore.RED}"
-        + f"{data['missing_metadata']}{colorama.Fore.RESET} validator"
-        + f"{'s' if data['missing_metadata'] != 1 else ''}"
-        + " due to missing metadata or non-active status on beacon chain"
-    )
 
-    additional_logs.append(
-        f"Failed to initialize {colorama.Fore.RED}{data['failures']}"
-        + f"{colorama.Fore.RESET} validator{'s' if data['failures'] != 1 else ''}"
-    )
+def init_validators(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    additional_logs = []
 
-    additional_logs.append(
-        f"Initialized {colorama.Fore.GREEN}{data['initialized']}"
-        + f"{colorama.Fore.RESET} validator{'s' if data['initialized'] != 1 else ''}"
-    )
+    for line, count in (
+        (MISSING_METADATA, data["missing_metadata"]),
+        (FAILED, data["failures"]),
+        (INITIALIZED, data["initialized"]),
+    ):
+        additional_logs.append(
+            line.format(count=count, plural="s" if count != 1 else "")
+        )
 
-    return (
-        f"Completed initialization for {colorama.Fore.MAGENTA}{data['shares']}"
-        + f"{colorama.Fore.RESET} validators"
-    ), additional_logs
+    return COMPLETED.format(count=data["shares"]), additional_logs
 
 
-def noop(_log):
+def noop(_record: LogRecord) -> tuple[str, list[str]] | None:
     return None
 
 
@@ -1,30 +1,33 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
-
+from ssvlogger.record import LogRecord
 from ssvlogger.common import seconds_to_ms_or_s
-
-
-def submitted_attestations(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    commitee = data["committee_id"][:12] + "..."
-    return (
-        f"{colorama.Fore.GREEN}Successfully submitted attestations{colorama.Fore.RESET}"
-        + f" for slot {colorama.Fore.LIGHTMAGENTA_EX}{data['slot']}"
-        + f"{colorama.Fore.RESET} in committee {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"0x{commitee}{colorama.Fore.RESET}"
-        + f" in {seconds_to_ms_or_s(data['total_consensus_time'])}"
+from ssvlogger.render import template
+
+SUBMITTED_ATTESTATIONS = template(
+    "{GREEN}Successfully submitted attestations{RESET}"
+    + " for slot {LIGHTMAGENTA_EX}{slot}{RESET}"
+    + " in committee {LIGHTMAGENTA_EX}0x{committee}{RESET} in {took}"
+)
+STARTED_DUTY = template(
+    "Executing duty at slot {LIGHTMAGENTA_EX}{slot}{RESET}"
+    + " in committee {LIGHTMAGENTA_EX}0x{committee}{RESET}"
+)
+
+
+def submitted_attestations(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return SUBMITTED_ATTESTATIONS.format(
+        slot=data["slot"],
+        committee=data["committee_id"][:12] + "...",
+        took=seconds_to_ms_or_s(data["total_consensus_time"]),
     ), []
 
 
-def started_duty(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    commitee = data["committee_id"][:12] + "..."
-    return (
-        f"Executing duty at slot {colorama.Fore.LIGHTMAGENTA_EX}{data['slot']}"
-        + f"{colorama.Fore.RESET} in committee {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"0x{commitee}{colorama.Fore.RESET}"
+def started_duty(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return STARTED_DUTY.format(
+        slot=data["slot"], committee=data["committee_id"][:12] + "..."
     ), []
 
 
@@ -1,58 +1,58 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
+from typing import Any
 
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
 from ssvlogger.matches.duty_scheduler import MATCHES
 
-
-def started_duty(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    validator = "0x" + data["pubkey"][:12] + "..."
+STARTED_DUTY = template(
+    "Executing {LIGHTCYAN_EX}{duty}{RESET} duty"
+    + " for validator {LIGHTMAGENTA_EX}{validator}{RESET}"
+    + " at slot {LIGHTMAGENTA_EX}{slot}{RESET}"
+)
+BLOCK_PROPOSAL = template(
+    "{status}{blinded}beacon block proposal for validator "
+    + "{LIGHTMAGENTA_EX}{validator}{RESET} at slot {LIGHTMAGENTA_EX}{slot}{RESET}"
+    + " with block hash of {CYAN}{block_hash}{RESET}"
+)
+RECEIVED = template("Received")
+FAILED_TO_SUBMIT = template("{RED}Failed to submit{RESET}")
+
+
+def duty_name(data: dict[str, Any]) -> str:
     duty = data.get("runner_role") or data.get("role") or "unknown"
-    duty = MATCHES.get(duty) or duty.replace("_", " ").lower()
-    return (
-        "Executing "
-        + f"{colorama.Fore.LIGHTCYAN_EX}{duty}{colorama.Fore.RESET} duty"
-        + " for validator "
-        + f"{colorama.Fore.LIGHTMAGENTA_EX}{validator}{colorama.Fore.RESET}"
-        + f" at slot {colorama.Fore.LIGHTMAGENTA_EX}{data['slot']}"
-        + f"{colorama.Fore.RESET}"
-    ), []
+    return MATCHES.get(duty) or duty.replace("_", " ").lower()
 
 
-def beacon_block_proposal(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
+def started_duty(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
     validator = "0x" + data["pubkey"][:12] + "..."
-    duty = data.get("runner_role") or data.get("role") or "unknown"
-    duty = MATCHES.get(duty) or duty.replace("_", " ").lower()
-    return (
-        "Received"
-        + (" blinded " if data["blinded"] else "")
-        + "beacon block proposal for validator "
-        + f"{colorama.Fore.LIGHTMAGENTA_EX}{validator}{colorama.Fore.RESET}"
-        + f" at slot {colorama.Fore.LIGHTMAGENTA_EX}{data['slot']}"
-        + f"{colorama.Fore.RESET} with block hash of "
-        + f"{colorama.Fore.CYAN}{data['block_hash']}{colorama.Fore.RESET}"
+    return STARTED_DUTY.format(
+        duty=duty_name(data), validator=validator, slot=data["slot"]
     ), []
 
 
-def could_not_submit_block(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
+def block_proposal(record: LogRecord, status: str) -> tuple[str, list[str]] | None:
+    data = record.fields
     validator = "0x" + data["pubkey"][:12] + "..."
-    duty = data.get("runner_role") or data.get("role") or "unknown"
-    duty = MATCHES.get(duty) or duty.replace("_", " ").lower()
-    return (
-        f"{colorama.Fore.RED}Failed to submit{colorama.Fore.RESET}"
-        + (" blinded " if data["blinded"] else "")
-        + "beacon block proposal for validator "
-        + f"{colorama.Fore.LIGHTMAGENTA_EX}{validator}{colorama.Fore.RESET}"
-        + f" at slot {colorama.Fore.LIGHTMAGENTA_EX}{data['slot']}"
-        + f"{colorama.Fore.RESET} with block hash of "
-        + f"{colorama.Fore.CYAN}{data['block_hash']}{colorama.Fore.RESET}"
+    return BLOCK_PROPOSAL.format(
+        status=status,
+        blinded=" blinded " if data["blinded"] else "",
+        validator=validator,
+        slot=data["slot"],
+        block_hash=data["block_hash"],
     ), []
 
 
+def beacon_block_proposal(record: LogRecord) -> tuple[str, list[str]] | None:
+    return block_proposal(record, RECEIVED.format())
+
+
+def could_not_submit_block(record: LogRecord) -> tuple[str, list[str]] | None:
+    return block_proposal(record, FAILED_TO_SUBMIT.format())
+
+
 Controller_Validator = {
     # SSV log entry: (function, silent)
     "arting duty process": (started_duty, False),
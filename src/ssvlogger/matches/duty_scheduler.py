@@ -1,8 +1,7 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
-
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
 from ssvlogger.matches.controller_commitee import submitted_attestations
 
 MATCHES = {
@@ -19,108 +18,99 @@ MATCHES = {
     "COMMITTEE_RUNNER": "Committee",
 }
 
-
-def received_head_event(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Updated to new chain head {colorama.Fore.LIGHTCYAN_EX}"
-        + f"{data['slot']}{colorama.Fore.RESET} at root {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"0x{data['block_root'][0:4]}..{data['block_root'][-4:]}{colorama.Fore.RESET}"
+HEAD_EVENT = template(
+    "Updated to new chain head {LIGHTCYAN_EX}{slot}{RESET}"
+    + " at root {LIGHTMAGENTA_EX}0x{root_start}..{root_end}{RESET}"
+)
+TICKER_EVENT = template("Checking for {GREEN}{duty}{RESET} duties")
+STARTING_HANDLER = template("Started {GREEN}{duty}{RESET} duty handler")
+STARTING_PROCESSING = template(
+    "Started processing {GREEN}{duty}{RESET} duty at slot {CYAN}{slot}{RESET}"
+)
+FAILED_TO_SUBMIT_BEACON = template(
+    "Failed to submit {CYAN}{handler}{RESET} job.\nError: {error}"
+)
+FAILED_SUBMIT_ATTESTATIONS = template(
+    "{RED}Failed to submit attestation{RESET}"
+    + " for slot {LIGHTMAGENTA_EX}{slot}{RESET}"
+    + " in committee {LIGHTMAGENTA_EX}0x{committee}{RESET}"
+)
+COULD_NOT_FIND_VALIDATOR = template(
+    "Failed to submit {CYAN}{handler}{RESET} job "
+    + "for validator {pubkey} due to non-existant validator"
+)
+FAILED_TO_FETCH = template(
+    "Failed to fetch {CYAN}{duty}{RESET}"
+    + " duties for current epoch: {RED}{error}{RESET}"
+)
+
+
+def duty_name(handler: str) -> str:
+    return MATCHES.get(handler) or handler.replace("_", " ").lower()
+
+
+def received_head_event(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return HEAD_EVENT.format(
+        slot=data["slot"],
+        root_start=data["block_root"][0:4],
+        root_end=data["block_root"][-4:],
     ), []
 
 
-def ticker_event(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        (
-            "Checking for "
-            + f"{colorama.Fore.GREEN}"
-            + (MATCHES.get(data['handler'])
-                or data['handler'].replace('_', ' ').lower())
-            + f"{colorama.Fore.RESET} duties"
-        ),
-        [],
-    )
+def ticker_event(record: LogRecord) -> tuple[str, list[str]] | None:
+    return TICKER_EVENT.format(duty=duty_name(record.fields["handler"])), []
 
 
-def no_duties(_log: list[str]) -> tuple[str, list[str]] | None:
+def no_duties(_record: LogRecord) -> tuple[str, list[str]] | None:
     return "No attester or sync-committee duties to execute", []
 
 
-def duty_scheduler_started(_log: list[str]) -> tuple[str, list[str]] | None:
+def duty_scheduler_started(_record: LogRecord) -> tuple[str, list[str]] | None:
     return "Started Duty Scheduler", []
 
 
-def starting_duty_handler(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    duty = MATCHES.get(data['handler']) or data['handler'].replace('_', ' ').lower()
-    return (
-        (
-            f"Started {colorama.Fore.GREEN}{duty}"
-            + f"{colorama.Fore.RESET} duty handler"
-        ),
-        [],
-    )
-
-
-def starting_duty_processing(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    duty = MATCHES.get(data['handler']) or data['handler'].replace('_', ' ').lower()
-    return (
-        (
-            f"Started processing {colorama.Fore.GREEN}{duty}"
-            + f"{colorama.Fore.RESET} duty at slot {colorama.Fore.CYAN}{data['slot']}"
-            + f"{colorama.Fore.RESET}"
-        ),
-        [],
-    )
-
-
-def failed_to_submit_beacon(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Failed to submit {colorama.Fore.CYAN}{data['handler']}{colorama.Fore.RESET} job.\n"
-        + "Error: "
-        + data["error"].replace('\\"', '"'),
-        [],
-    )
-
-
-def failed_submit_attestations(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    commitee = data["committee_id"][:12] + "..."
-    return (
-        f"{colorama.Fore.RED}Failed to submit attestation{colorama.Fore.RESET}"
-        + f" for slot {colorama.Fore.LIGHTMAGENTA_EX}{data['slot']}"
-        + f"{colorama.Fore.RESET} in committee {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"0x{commitee}{colorama.Fore.RESET}"
+def starting_duty_handler(record: LogRecord) -> tuple[str, list[str]] | None:
+    return STARTING_HANDLER.format(duty=duty_name(record.fields["handler"])), []
+
+
+def starting_duty_processing(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return STARTING_PROCESSING.format(
+        duty=duty_name(data["handler"]), slot=data["slot"]
     ), []
 
 
-def could_not_find_validator(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Failed to submit {colorama.Fore.CYAN}{data['handler']}{colorama.Fore.RESET} job "
-        + f"for validator {data['pubkey'][:8]} due to non-existant validator"
+def failed_to_submit_beacon(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return FAILED_TO_SUBMIT_BEACON.format(
+        handler=data["handler"], error=data["error"].replace('\\"', '"')
     ), []
 
 
-def subscribing_to_head_events(_log: list[str]) -> tuple[str, list[str]] | None:
+def failed_submit_attestations(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return FAILED_SUBMIT_ATTESTATIONS.format(
+        slot=data["slot"], committee=data["committee_id"][:12] + "..."
+    ), []
+
+
+def could_not_find_validator(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return COULD_NOT_FIND_VALIDATOR.format(
+        handler=data["handler"], pubkey=data["pubkey"][:8]
+    ), []
+
+
+def subscribing_to_head_events(_record: LogRecord) -> tuple[str, list[str]] | None:
     return "Subscribing to head events", []
 
 
-def failed_to_fetch(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    duty = MATCHES.get(data['handler']) or data['handler'].replace('_', ' ').lower()
-    return (
-        (
-            f"Failed to fetch {colorama.Fore.CYAN}{duty}"
-            + f"{colorama.Fore.RESET}"
-            + f" duties for current epoch: {colorama.Fore.RED}"
-            + f"{data['error']}{colorama.Fore.RESET}"
-        ),
-        [],
-    )
+def failed_to_fetch(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return FAILED_TO_FETCH.format(
+        duty=duty_name(data["handler"]), error=data["error"]
+    ), []
 
 
 DutyScheduler = {
@@ -1,32 +1,27 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
 
+FAILED_TO_FIND_EVENT = template("Failed to find event by ID {LIGHTCYAN_EX}{hash}{RESET}")
+UNKNOWN_EVENT_NAME = template("Ignoring unknown event {RED}{name}{RESET}")
 
-def malformed_event(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
+
+def malformed_event(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
     return (
-        f"Malformed Event: {log[3].split(':')[1].strip()}. Transaction hash: {data['tx_hash']}",
+        f"Malformed Event: {record.message.split(':')[1].strip()}. "
+        + f"Transaction hash: {data['tx_hash']}",
         [],
     )
 
 
-def failed_to_find_event(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Failed to find event by ID {colorama.Fore.LIGHTCYAN_EX}"
-        + f"{data['hash']}{colorama.Fore.RESET}",
-        [],
-    )
+def failed_to_find_event(record: LogRecord) -> tuple[str, list[str]] | None:
+    return FAILED_TO_FIND_EVENT.format(hash=record.fields["hash"]), []
 
 
-def unknown_event_name(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Ignoring unknown event {colorama.Fore.RED}{data['name']}{colorama.Fore.RESET}",
-        [],
-    )
+def unknown_event_name(record: LogRecord) -> tuple[str, list[str]] | None:
+    return UNKNOWN_EVENT_NAME.format(name=record.fields["name"]), []
 
 
 EventHandler = {
@@ -1,23 +1,26 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
 
+SUBSCRIBING = template(
+    "Subscribing to registry contract events after block "
+    + "{LIGHTMAGENTA_EX}{from_block}{RESET}"
+)
+FINISHED_SYNCING = template(
+    "Processing registry events from block {LIGHTMAGENTA_EX}{from_block}{RESET}"
+    + " to {LIGHTMAGENTA_EX}{last_block}{RESET}"
+)
 
-def subscribing(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        "Subscribing to registry contract events after block "
-        + f"{colorama.Fore.LIGHTMAGENTA_EX}{data['from_block']}{colorama.Fore.RESET}"
-    ), []
+
+def subscribing(record: LogRecord) -> tuple[str, list[str]] | None:
+    return SUBSCRIBING.format(from_block=record.fields["from_block"]), []
 
 
-def finished_syncing(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Processing registry events from block {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['from_block']}{colorama.Fore.RESET} to {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['last_processed_block']}{colorama.Fore.RESET}"
+def finished_syncing(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return FINISHED_SYNCING.format(
+        from_block=data["from_block"], last_block=data["last_processed_block"]
     ), []
 
 
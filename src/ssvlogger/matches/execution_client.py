@@ -1,64 +1,63 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
-
-
-def received_head_event(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Processed {colorama.Fore.LIGHTMAGENTA_EX}{data['events']}"
-        + f" {colorama.Fore.RESET}registry events ({data['progress']} complete)"
-    ), []
-
-
-def connecting(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Connecting to execution client at {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['address']}{colorama.Fore.RESET}"
-    ), []
-
-
-def failed_to_stream(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        "Cannot get events from execution client "
-        + f"{'at ' if data.get('address') is not None else ''}{colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data.get('address') or ''}{colorama.Fore.RESET}: {data['error']}"
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
+
+FETCHED_EVENTS = template(
+    "Processed {LIGHTMAGENTA_EX}{events} {RESET}registry events ({progress} complete)"
+)
+CONNECTING = template("Connecting to execution client at {LIGHTMAGENTA_EX}{address}{RESET}")
+FAILED_TO_STREAM = template(
+    "Cannot get events from execution client {at}{LIGHTMAGENTA_EX}{address}{RESET}: {error}"
+)
+CONNECTED = template(
+    "Connected to execution client at {LIGHTMAGENTA_EX}{address}{RESET} in {took}"
+)
+RECONNECTING = template(
+    "Reconnecting to execution client at {LIGHTMAGENTA_EX}{address}{RESET}"
+)
+COULD_NOT_RECONNECT = template(
+    "Reconnecting to execution client at {LIGHTMAGENTA_EX}{address}{RESET} ({error})"
+)
+RETURNED_ERROR = template(
+    "Unable to communicate with execution client: {RED}{error}{RESET}"
+)
+
+
+def received_head_event(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return FETCHED_EVENTS.format(events=data["events"], progress=data["progress"]), []
+
+
+def connecting(record: LogRecord) -> tuple[str, list[str]] | None:
+    return CONNECTING.format(address=record.fields["address"]), []
+
+
+def failed_to_stream(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return FAILED_TO_STREAM.format(
+        at="at " if data.get("address") is not None else "",
+        address=data.get("address") or "",
+        error=data["error"],
     ), []
 
 
-def connected(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Connected to execution client at {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['address']}{colorama.Fore.RESET} in {data['took']}"
-    ), []
+def connected(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return CONNECTED.format(address=data["address"], took=data["took"]), []
 
 
-def reconnecting(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Reconnecting to execution client at {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['address']}{colorama.Fore.RESET}"
-    ), []
+def reconnecting(record: LogRecord) -> tuple[str, list[str]] | None:
+    return RECONNECTING.format(address=record.fields["address"]), []
 
 
-def could_not_reconnect(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Reconnecting to execution client at {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['address']}{colorama.Fore.RESET} ({data['error']})"
-    ), []
+def could_not_reconnect(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return COULD_NOT_RECONNECT.format(address=data["address"], error=data["error"]), []
 
 
-def returned_error(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Unable to communicate with execution client: {colorama.Fore.RED}"
-        + f"{data['error']}{colorama.Fore.RESET}"
-    ), []
+def returned_error(record: LogRecord) -> tuple[str, list[str]] | None:
+    return RETURNED_ERROR.format(error=record.fields["error"]), []
 
 
 ExecutionClient = {
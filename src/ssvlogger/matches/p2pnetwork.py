@@ -1,64 +1,54 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
-
-
-def verified_handshake_nodeinfo(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    if "conn_dir" not in data.keys():
-        print(data)
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
+
+HANDSHAKE = template(
+    "Processing {LIGHTMAGENTA_EX}{direction}{RESET}"
+    + " connection from {GREEN}{addr}@{ip}{RESET}"
+)
+SERVICES_CONFIGURED = template(
+    "Configured P2P networking. Node id: {LIGHTMAGENTA_EX}{peer}...{RESET}"
+)
+DISCV5 = template(
+    "Using discv5 for discovery. Using {LIGHTMAGENTA_EX}{count}{RESET} bootnodes"
+)
+SELECTING_PEERS = template("Selecting {LIGHTCYAN_EX}{count}{RESET} peers for p2p")
+PROPOSED_PEERS = template("Proposed {LIGHTCYAN_EX}{count}{RESET} discovered peers")
+
+
+def verified_handshake_nodeinfo(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
     direction = data["conn_dir"]
     ip = data["remote_addr"]
     ip = (ip[1:]).split("/")
     ip = f"{ip[1]}:{ip[3]}"
     addr = data["peer_id"][:16] + "..."
-    return (
-        f"Processing {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{direction}{colorama.Fore.RESET}"
-        + f" connection from {colorama.Fore.GREEN}{addr}@{ip}{colorama.Fore.RESET}",
-        [],
-    )
+    return HANDSHAKE.format(direction=direction, addr=addr, ip=ip), []
 
 
-def starting(_log: list[str]) -> tuple[str, list[str]] | None:
+def starting(_record: LogRecord) -> tuple[str, list[str]] | None:
     return "Starting P2P networking", []
 
 
-def configuring(_log: list[str]) -> tuple[str, list[str]] | None:
+def configuring(_record: LogRecord) -> tuple[str, list[str]] | None:
     return "Configuring P2P networking", []
 
 
-def services_configured(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Configured P2P networking. Node id: {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['selfPeer'][:16]}...{colorama.Fore.RESET}"
-    ), []
+def services_configured(record: LogRecord) -> tuple[str, list[str]] | None:
+    return SERVICES_CONFIGURED.format(peer=record.fields["selfPeer"][:16]), []
 
 
-def discv5(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Using discv5 for discovery. Using {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{len(data['bootnodes'])}{colorama.Fore.RESET} bootnodes"
-    ), []
+def discv5(record: LogRecord) -> tuple[str, list[str]] | None:
+    return DISCV5.format(count=len(record.fields["bootnodes"])), []
 
 
-def selecting_discovered_peers(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Selecting {colorama.Fore.LIGHTCYAN_EX}"
-        + f"{data['pool_size']}{colorama.Fore.RESET} peers for p2p"
-    ), []
+def selecting_discovered_peers(record: LogRecord) -> tuple[str, list[str]] | None:
+    return SELECTING_PEERS.format(count=record.fields["pool_size"]), []
 
 
-def proposed_discovered_peers(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Proposed {colorama.Fore.LIGHTCYAN_EX}"
-        + f"{data['count']}{colorama.Fore.RESET} discovered peers"
-    ), []
+def proposed_discovered_peers(record: LogRecord) -> tuple[str, list[str]] | None:
+    return PROPOSED_PEERS.format(count=record.fields["count"]), []
 
 
 P2PNetwork = {
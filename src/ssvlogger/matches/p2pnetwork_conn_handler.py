@@ -1,16 +1,17 @@
 # pylint: disable=C0116, C0114, missing-module-docstring
 
-import json
-import colorama
+from ssvlogger.record import LogRecord
+from ssvlogger.render import template
 
+HANDSHAKE = template(
+    "Completed {LIGHTCYAN_EX}{direction}{RESET}"
+    + " handshake with {LIGHTMAGENTA_EX}{address}{RESET}"
+)
 
-def verified_handshake_nodeinfo(log: list[str]) -> tuple[str, list[str]] | None:
-    data = json.loads(log[4])
-    return (
-        f"Completed {colorama.Fore.LIGHTCYAN_EX}{data['conn_dir']}"
-        + f"{colorama.Fore.RESET} handshake with {colorama.Fore.LIGHTMAGENTA_EX}"
-        + f"{data['remote_addr']}{colorama.Fore.RESET}"
-    ), []
+
+def verified_handshake_nodeinfo(record: LogRecord) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return HANDSHAKE.format(direction=data["conn_dir"], address=data["remote_addr"]), []
 
 
 P2PNetwork_ConnHandler = {
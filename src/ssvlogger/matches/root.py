@@ -0,0 +1,221 @@
+# pylint: disable=C0116, C0114, missing-module-docstring
+
+from typing import Any
+
+from ssvlogger.common import loads
+from ssvlogger.record import LogRecord
+from ssvlogger.render import Fore, template
+
+IGNORED_COMPONENTS = ("Observability", "MetricsHandler", "Migrations")
+OUT_OF_SYNC = (
+    "ethereum node(s) are either out "
+    + "of sync or down. Ensure the nodes are healthy to resume."
+)
+IGNORED_MESSAGES = (
+    "starting event listener",
+    "getting operator private key from keystore",
+    "using badger db",
+)
+
+NETWORK_CONFIG = template("Loading {LIGHTMAGENTA_EX}{name}{RESET} network config")
+SSV_NETWORK = template("Configuring SSV node for running on {MAGENTA}{name}{RESET}")
+CONSENSUS_CLIENT = template("Connecting to consensus clients {MAGENTA}{address}{RESET}")
+CONSENSUS_CLIENT_ADDRESS = template(" - {MAGENTA}{address}{RESET}")
+APPLYING_MIGRATIONS = template("Applying {LIGHTBLUE_EX}{count}{RESET} migrations")
+OPERATOR_KEYS = template("Loaded operator key ({MAGENTA}{pubkey}{RESET})")
+MAX_PEERS = template(
+    "Increasing max peers from {LIGHTCYAN_EX}{old}{RESET}"
+    + " to {LIGHTCYAN_EX}{new}{RESET}"
+)
+OPERATOR_CONFIGURED = [
+    template("{GREEN}╔═╗╔╦╗╔═╗╦═╗╔╦╗╦ ╦╔═╗  ╔═╗╦ ╦╔═╗╔═╗╔═╗╔═╗╔═╗{RESET}"),
+    template("{GREEN}╚═╗ ║ ╠═╣╠╦╝ ║ ║ ║╠═╝  ╚═╗║ ║║  ║  ║╣ ╚═╗╚═╗{RESET}"),
+    template("{GREEN}╚═╝ ╩ ╩ ╩╩╚═ ╩ ╚═╝╩    ╚═╝╚═╝╚═╝╚═╝╚═╝╚═╝╚═╝{RESET}"),
+]
+NODE_NOT_HEALTHY = template("Issue with {node} {RED}{error}")
+
+
+def unescape_traceback(data: dict[str, Any]) -> str:
+    return (
+        data["errorVerbose"]
+        .replace('\\"', '"')
+        .replace("\\n", "\n")
+        .replace("\\r", "\r")
+        .replace("\\t", "\t")
+    )
+
+
+def logger_initialized(_record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return "SSV logger initialized", []
+
+
+def ignored(_record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return None
+
+
+def no_fields(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return record.message, []
+
+
+def network_config(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return NETWORK_CONFIG.format(name=record.fields["name"]), []
+
+
+def ssv_network(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    data = record.fields
+    if (config := data.get("config")) is not None:
+        name = loads(config)["name"]
+    else:
+        name = data.get("network") or "unknown"
+    return SSV_NETWORK.format(name=name), []
+
+
+def consensus_client(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return CONSENSUS_CLIENT.format(address=record.fields["address"]), []
+
+
+def consensus_clients(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    additional_logs = []
+    for address in record.fields["addresses"]:
+        additional_logs.append(CONSENSUS_CLIENT_ADDRESS.format(address=address))
+    return "Connecting to the following consensus clients:", additional_logs
+
+
+def applying_migrations(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return APPLYING_MIGRATIONS.format(count=record.fields["count"]), []
+
+
+def applied_migrations(_record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return "Applied migrations sucessfully", []
+
+
+def operator_keys(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return OPERATOR_KEYS.format(pubkey=record.fields["pubkey"][16:]), []
+
+
+def registry_sync_stats(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    data = record.fields
+    additional_logs = []
+    additional_logs.append(f"Operator ID           : {data['my_operator_id']}")
+    additional_logs.append(f"Operators on network  : {data['operators']}")
+    additional_logs.append(f"Validators on network : {data['validators']}")
+    additional_logs.append(f"Liquidated Validators : {data['liquidated_validators']}")
+    additional_logs.append(f"Validators managed    : {data['my_validators']}")
+    return "Network statistics: ", additional_logs
+
+
+def max_peers(record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    data = record.fields
+    return MAX_PEERS.format(old=data["old_max_peers"], new=data["new_max_peers"]), []
+
+
+def operator_configured(_record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    additional_logs = [line.format() for line in OPERATOR_CONFIGURED]
+    return "Operator configured sucessfully", additional_logs
+
+
+def node_not_healthy(record: LogRecord, args: Any) -> tuple[str, list[str]] | None:
+    data = record.fields
+    node = data["node"]
+    error = data["error"].replace('\\"', '"')
+    tolog = NODE_NOT_HEALTHY.format(node=node, error=error)
+    if args.traceback:
+        tolog += f"\nFull Traceback:\n{unescape_traceback(data)}"
+    return tolog + Fore.RESET, []
+
+
+def nodes_not_healthy(_record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return "not all nodes are healthy", []
+
+
+def nodes_out_of_sync(_record: LogRecord, _args: Any) -> tuple[str, list[str]] | None:
+    return OUT_OF_SYNC, []
+
+
+def fallback(record: LogRecord, args: Any) -> tuple[str, list[str]] | None:
+    """Generic error handling and fallback"""
+
+    data = record.fields
+
+    if record.level not in ("ERROR", "FATAL"):
+        return record.text(), []
+
+    if data:
+        tolog = f"{record.message} - {data['error']}"
+        if args.traceback and "errorVerbose" in data:
+            tolog += f"\nFull Traceback:\n{unescape_traceback(data)}"
+    elif record.raw is not None:
+        tolog = f"{record.message} - {record.raw}"
+    else:
+        tolog = record.message
+
+    return tolog, []
+
+
+Root = {
+    # Edge case logs that don't belong to a specific module, checked in order
+    # Name: (test, function)
+    "logger initialized": (
+        lambda r: r.component == "Observability"
+        and r.message == "global logger initialized",
+        logger_initialized,
+    ),
+    "ignored": (
+        lambda r: r.component in IGNORED_COMPONENTS or r.message in IGNORED_MESSAGES,
+        ignored,
+    ),
+    "no fields": (
+        lambda r: r.component is None and r.raw is not None and len(r.fields) == 3,
+        no_fields,
+    ),
+    "network config": (
+        lambda r: r.message == "found network config by name",
+        network_config,
+    ),
+    "ssv network": (lambda r: r.message == "setting ssv network", ssv_network),
+    "consensus client": (
+        lambda r: r.message == "consensus client: connecting",
+        consensus_client,
+    ),
+    "consensus clients": (
+        lambda r: r.message == "consensus client: connecting (multi client)",
+        consensus_clients,
+    ),
+    "applying migrations": (
+        lambda r: r.message == "applying migrations",
+        applying_migrations,
+    ),
+    "applied migrations": (
+        lambda r: r.message == "applied migrations successfully",
+        applied_migrations,
+    ),
+    "operator keys": (
+        lambda r: r.message == "successfully loaded operator keys",
+        operator_keys,
+    ),
+    "registry sync stats": (
+        lambda r: r.message == "historical registry sync stats",
+        registry_sync_stats,
+    ),
+    "max peers": (
+        lambda r: r.message
+        == "increasing MaxPeers to match the operator's subscribed subnets",
+        max_peers,
+    ),
+    "operator configured": (
+        lambda r: "OPERATOR SUCCESSFULLY CONFIGURED" in r.message,
+        operator_configured,
+    ),
+    # Specific Error Handling
+    "node not healthy": (lambda r: "node is not healthy" in r.message, node_not_healthy),
+    "nodes not healthy": (
+        lambda r: "not all nodes are healthy" in r.message,
+        nodes_not_healthy,
+    ),
+    "nodes out of sync": (
+        lambda r: OUT_OF_SYNC in r.message,
+        nodes_out_of_sync,
+    ),
+    # Generic Error handling and fallback
+    "fallback": (lambda r: True, fallback),
+}
@@ -0,0 +1,99 @@
+# pylint: disable=C0116, C0114
+
+"""Reading several, possibly compressed, log files as one stream in
+timestamp order"""
+
+import contextlib
+import glob
+import gzip
+import heapq
+import io
+import lzma
+from operator import itemgetter
+from typing import Any, BinaryIO, Iterator
+
+from ssvlogger.journal import export_entries, json_entries
+from ssvlogger.prefilter import item_time
+from ssvlogger.reader import iter_lines
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSED = (".gz", ".xz", ".zst")
+
+
+def expand_paths(patterns: list[str]) -> list[str]:
+    """Expands glob patterns into the files they match, in sorted order"""
+
+    paths = []
+    for pattern in patterns:
+        if not any(c in pattern for c in "*?["):
+            paths.append(pattern)
+        elif matches := sorted(glob.glob(pattern)):
+            paths.extend(matches)
+        else:
+            raise FileNotFoundError(f"No files match {pattern}")
+    return paths
+
+
+def is_compressed(path: str) -> bool:
+    return path.endswith(COMPRESSED)
+
+
+def open_source(path: str) -> BinaryIO:
+    """Opens a log file for reading, decompressing it as it is read"""
+
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".xz"):
+        return lzma.open(path, "rb")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("Reading .zst files requires the zstandard package")
+        with contextlib.ExitStack() as stack:  # Closes the file if this fails
+            raw = stack.enter_context(open(path, "rb"))
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                raw, read_across_frames=True, closefd=True
+            )
+            stack.pop_all()
+        return io.BufferedReader(reader)
+    return open(path, "rb")
+
+
+def read_source(path: str, fmt: str) -> Iterator[Any]:
+    """Yields the lines of a log file, or its entries for journal formats"""
+
+    with open_source(path) as stream:
+        if fmt == "journal-export":
+            yield from export_entries(stream)
+        elif fmt == "journal-json":
+            yield from json_entries(iter_lines(stream))
+        else:
+            yield from iter_lines(stream)
+
+
+def timed(index: int, items: Iterator[Any], fmt: str) -> Iterator[tuple[str, int, Any]]:
+    """Pairs items with their timestamp, items without one (such as stray
+    output of the node) take the timestamp of the item before them"""
+
+    last = ""
+    for item in items:
+        if time := item_time(item, fmt):
+            last = time
+        yield last, index, item
+
+
+def merge_sources(paths: list[str], fmt: str) -> Iterator[tuple[int, Any]]:
+    """Yields (index of the path, item) for the items of all `paths` in
+    timestamp order.
+
+    Each file is expected to be in time order already, so a k-way merge
+    only holds one item per file in memory at a time. Items with the same
+    timestamp keep the order of `paths`.
+    """
+
+    sources = [timed(i, read_source(path, fmt), fmt) for i, path in enumerate(paths)]
+    for _, index, item in heapq.merge(*sources, key=itemgetter(0)):
+        yield index, item
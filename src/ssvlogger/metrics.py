@@ -0,0 +1,292 @@
+# pylint: disable=C0116, C0114
+
+"""Prometheus metrics derived from parsed logs, served on /metrics for
+--metrics"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from ssvlogger import dispatch
+from ssvlogger.record import LogRecord
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds of the consensus time histogram buckets, in seconds
+CONSENSUS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 12.0)
+
+Labels = tuple[str, ...]
+
+
+def escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def label_text(names: Labels, values: Labels) -> str:
+    pairs = [f'{name}="{escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """A metric with a value per combination of its labels"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Labels = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.values: dict[Labels, Any] = {}
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{label_text(self.labels, labels)} {value}"
+            for labels, value in self.values.items()
+        ]
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    """A metric that only goes up"""
+
+    kind = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    """A metric set to the last value seen"""
+
+    kind = "gauge"
+
+    def set(self, value: float, labels: Labels = ()):
+        self.values[labels] = value
+
+
+class Histogram(Metric):
+    """Counts of values by the upper bounds of `buckets`, with their sum"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...]):
+        super().__init__(name, help_text)
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.sum += value
+
+    def samples(self) -> list[str]:
+        lines, total = [], 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {total}')
+        lines.append(f"{self.name}_sum {self.sum}")
+        lines.append(f"{self.name}_count {total}")
+        return lines
+
+
+class Metrics:
+    """The metrics of a log stream, updated by observe() in constant time
+    per log from the fields its matcher uses, without rendering it.
+    `metric` holds them by name."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metric: dict[str, Metric] = {
+            "logs": Counter("ssvlogger_logs_total", "Logs read by level", ("level",)),
+            "consensus_events": Counter(
+                "ssvlogger_consensus_client_events_total",
+                "Consensus client connections, errors and sync changes",
+                ("event",),
+            ),
+            "consensus_synced": Gauge(
+                "ssvlogger_consensus_client_synced",
+                "Whether a consensus client was last reported in sync (1) or not (0)",
+                ("address",),
+            ),
+            "execution_reconnects": Counter(
+                "ssvlogger_execution_client_reconnects_total",
+                "Execution client reconnection attempts",
+            ),
+            "execution_errors": Counter(
+                "ssvlogger_execution_client_errors_total",
+                "Errors returned by or streaming from the execution client",
+            ),
+            "attestations": Counter(
+                "ssvlogger_attestations_total",
+                "Attestations submitted, by result",
+                ("result",),
+            ),
+            "duty_failures": Counter(
+                "ssvlogger_duty_failures_total",
+                "Duties that failed to be submitted or fetched, by role",
+                ("role",),
+            ),
+            "consensus_time": Histogram(
+                "ssvlogger_consensus_time_seconds",
+                "Total consensus time of duties",
+                CONSENSUS_BUCKETS,
+            ),
+            "validators": Gauge(
+                "ssvlogger_validators",
+                "Validators last reported by the node, by status",
+                ("status",),
+            ),
+        }
+
+    def observe(self, record: LogRecord):
+        fields = record.fields
+        with self.lock:
+            self.metric["logs"].inc((record.level,))
+
+            if (consensus_time := fields.get("total_consensus_time")) is not None:
+                try:
+                    self.metric["consensus_time"].observe(float(consensus_time))
+                except (TypeError, ValueError):
+                    pass
+
+            if record.component is None:
+                return
+            if (index := dispatch.find_component(record.component)) is None:
+                return
+            if (update := EVENTS.get((index, index.find(record.message)))) is not None:
+                try:
+                    update(self.metric, fields)
+                except (KeyError, TypeError, ValueError):
+                    pass
+
+    def render(self) -> str:
+        with self.lock:
+            lines = [line for metric in self.metric.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+# An update reads all the fields it needs before changing any metric, so
+# a log missing one leaves the metrics as they were
+Update = Callable[[dict[str, Metric], dict[str, Any]], None]
+
+
+def consensus_event(event: str, synced: int | None = None) -> Update:
+    def update(metric: dict[str, Metric], fields: dict[str, Any]):
+        metric["consensus_events"].inc((event,))
+        if synced is not None and (address := fields.get("address")) is not None:
+            metric["consensus_synced"].set(synced, (address,))
+
+    return update
+
+
+def increment(name: str, labels: tuple[str, ...] = ()) -> Update:
+    return lambda metric, _: metric[name].inc(labels)
+
+
+def duty_failure(metric: dict[str, Metric], fields: dict[str, Any]):
+    metric["duty_failures"].inc((fields["handler"].removesuffix("_RUNNER"),))
+
+
+def validator_status(metric: dict[str, Metric], fields: dict[str, Any]):
+    metric["validators"].set(fields["count"], (fields["status"],))
+
+
+def validators_initializing(metric: dict[str, Metric], fields: dict[str, Any]):
+    metric["validators"].set(fields["shares count"], ("total",))
+
+
+# Validator statuses set by init_validators, with their fields
+VALIDATOR_COUNTS = (
+    ("total", "shares"),
+    ("initialized", "initialized"),
+    ("failed", "failures"),
+    ("missing_metadata", "missing_metadata"),
+)
+
+
+def init_validators(metric: dict[str, Metric], fields: dict[str, Any]):
+    counts = [(fields[key], status) for status, key in VALIDATOR_COUNTS]
+    for value, status in counts:
+        metric["validators"].set(value, (status,))
+
+
+# Metrics updated per matcher: (table, message): update(metrics, fields)
+UPDATES: dict[tuple[str, str], Update] = {
+    ("ConsensusClient", "consensus client connected"): consensus_event("connected", 1),
+    ("ConsensusClient", "consensus client disconnected"): consensus_event("disconnected", 0),
+    ("ConsensusClient", "consensus client desynced"): consensus_event("desynced", 0),
+    ("ConsensusClient", "consensus client synced"): consensus_event("synced", 1),
+    ("ConsensusClient", "client returned an error"): consensus_event("error"),
+    ("ExecutionClient", "reconnecting"): increment("execution_reconnects"),
+    ("ExecutionClient", "could not reconnect, still trying"): increment("execution_reconnects"),
+    ("ExecutionClient", "failed to stream registry events, reconnecting"): increment(
+        "execution_errors"
+    ),
+    ("ExecutionClient", "Execution client returned an error"): increment("execution_errors"),
+    ("Controller_Committee", "successfully submitted attestations"): increment(
+        "attestations", ("ok",)
+    ),
+    ("DutyScheduler", "successfully submitted attestations"): increment("attestations", ("ok",)),
+    ("DutyScheduler", "failed to submit attestation"): increment("attestations", ("failed",)),
+    ("DutyScheduler", "failed to submit beacon committee subscription"): duty_failure,
+    ("DutyScheduler", "failed to fetch duties for current epoch"): duty_failure,
+    ("Controller", "initializing validators"): validators_initializing,
+    ("Controller", "validator initialization is done"): init_validators,
+    ("Controller", "recording validator status"): validator_status,
+}
+
+# The same by the MessageIndex of the table and the key the message is
+# found under, so messages sharing a matcher are told apart
+EVENTS = {
+    (dispatch.table_index(table), message): update
+    for (table, message), update in UPDATES.items()
+}
+
+
+def serve(metrics: Metrics, host: str, port: int) -> ThreadingHTTPServer:
+    """Serves `metrics` on http://host:port/metrics from a daemon thread"""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Answers GET /metrics"""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_):  # Keep scrapes out of the output
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    bound = server.server_address
+    print(f"Serving metrics on http://{bound[0]}:{bound[1]}/metrics", file=sys.stderr)
+    return server
+
+
+def parse_endpoint(spec: str) -> tuple[str, int]:
+    """Parses `[HOST:]PORT`, listening on localhost without a host"""
+
+    host, _, port = spec.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"No port in {spec}")
+    return host.strip("[]") or "127.0.0.1", int(port)
@@ -0,0 +1,94 @@
+# pylint: disable=C0116, C0114
+
+"""Buffered output stage for rendered log lines"""
+
+import threading
+import time
+from typing import Callable, Iterable, TextIO
+
+# Flush once this many characters are buffered
+FLUSH_SIZE = 64 * 1024
+
+# Flush a partially filled buffer once no line has arrived for this long
+IDLE_TIMEOUT = 0.1
+
+
+class IdleFlusher:
+    """Thread calling `flush(self)` every `idle` seconds until stopped,
+    with the time of the last write to check against"""
+
+    def __init__(self, idle: float, flush: Callable[["IdleFlusher"], None]):
+        self.idle = idle
+        self.last_write = 0.0
+        self.closed = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(flush,), daemon=True)
+        self.thread.start()
+
+    def run(self, flush: Callable[["IdleFlusher"], None]):
+        while not self.closed.wait(self.idle):
+            flush(self)
+
+    def stop(self):
+        self.closed.set()
+        self.thread.join()
+
+
+class BufferedWriter:
+    """Collects rendered lines and writes them to `stream` in large chunks.
+
+    Lines are written once FLUSH_SIZE characters are pending, when `idle`
+    seconds pass without a new line (so followed logs stay interactive)
+    and on close. Pass `idle=None` to disable the idle flush, e.g. when
+    replaying a file where only throughput matters.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        size: int = FLUSH_SIZE,
+        idle: float | None = IDLE_TIMEOUT,
+    ):
+        self.stream = stream
+        self.size = size
+
+        self.pending: list[str] = []
+        self.pending_size = 0
+
+        self.lock = threading.Lock()
+        self.flusher = None if idle is None else IdleFlusher(idle, self._flush_idle)
+
+    def write_lines(self, lines: Iterable[str]):
+        with self.lock:
+            for line in lines:
+                self.pending.append(line)
+                self.pending_size += len(line) + 1
+            if self.flusher is not None:
+                self.flusher.last_write = time.monotonic()
+            if self.pending_size >= self.size:
+                self._flush()
+
+    def write(self, line: str):
+        self.write_lines((line,))
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        if self.flusher is not None:
+            self.flusher.stop()
+        self.flush()
+
+    def _flush(self):
+        if not self.pending:
+            return
+        self.pending.append("")
+        self.stream.write("\n".join(self.pending))
+        self.stream.flush()
+        self.pending = []
+        self.pending_size = 0
+
+    def _flush_idle(self, flusher: IdleFlusher):
+        with self.lock:
+            if time.monotonic() - flusher.last_write >= flusher.idle:
+                self._flush()
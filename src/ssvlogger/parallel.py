@@ -0,0 +1,187 @@
+# pylint: disable=C0116, C0114
+
+"""Multi-process rendering of log files and streams"""
+
+import mmap
+import queue
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterator
+
+from ssvlogger.render import colour_enabled, use_renderer
+
+# Files smaller than this are not worth starting worker processes for
+MIN_PARALLEL_SIZE = 8 * 1024 * 1024
+
+# Approximate amount of the file handed to a worker at a time
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Most lines of a stream handed to a worker at a time
+BATCH_LINES = 2048
+
+# Seconds the writer waits for more input before handing out the results
+# that are ready, so a quiet stream is not held back behind a busy worker
+POLL_INTERVAL = 0.01
+
+Renderer = Callable[[str, Any], list[str]]
+
+# The renderer and arguments of a stream worker, set once per worker by
+# init_worker rather than sent with every batch. Worker threads share it,
+# so stream_pool sets it once before starting them.
+WORKER: tuple[Renderer, Any] | None = None
+
+
+def chunk_offsets(
+    mm: mmap.mmap, start: int, size: int, chunk_size: int = CHUNK_SIZE
+) -> list[tuple[int, int]]:
+    """Splits the bytes `start` to `size` of a mapped file into (start, end)
+    ranges that end on a newline"""
+
+    offsets = []
+
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            newline = mm.find(b"\n", end - 1)
+            end = size if newline < 0 else newline + 1
+        offsets.append((start, end))
+        start = end
+
+    return offsets
+
+
+def render_chunk(job: tuple[str, int, int, Renderer, Any]) -> list[str]:
+    """Worker entry point, renders the lines of one range of a file"""
+
+    path, start, end, render, args = job
+
+    with open(path, "rb") as inp:
+        with mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = mm[start:end].decode("utf-8", errors="replace")
+
+    out = []
+    for line in text.split("\n"):
+        out.extend(render(line, args))
+    return out
+
+
+def render_file(
+    path: str, render: Renderer, args: Any, jobs: int, spans: list[tuple[int, int]]
+) -> Iterator[list[str]]:
+    """Renders the `spans` (start, end) of a log file with `jobs` processes,
+    yielding the rendered lines of each chunk in the original order of the
+    file"""
+
+    with open(path, "rb") as inp:
+        with mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offsets = [o for span in spans for o in chunk_offsets(mm, *span)]
+
+    work = [(path, start, end, render, args) for start, end in offsets]
+
+    # Workers started with spawn rather than fork need the renderer set again
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=use_renderer, initargs=(colour_enabled(),)
+    ) as pool:
+        # Keep a bounded number of chunks in flight so memory use does not
+        # depend on the size of the file
+        pending: deque[Future] = deque()
+        for job in work:
+            pending.append(pool.submit(render_chunk, job))
+            if len(pending) > jobs * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def init_worker(colour: bool, render: Renderer, args: Any):
+    global WORKER  # pylint: disable=global-statement
+
+    use_renderer(colour)
+    WORKER = (render, args)
+
+
+def render_batch(lines: list[str]) -> list[str]:
+    """Worker entry point, renders a batch of lines of a stream"""
+
+    render, args = WORKER
+    out = []
+    for line in lines:
+        out.extend(render(line, args))
+    return out
+
+
+def free_threaded() -> bool:
+    """Whether this is a free-threaded build running without the GIL"""
+
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def stream_pool(jobs: int, render: Renderer, args: Any) -> Executor:
+    """Threads where they run in parallel, processes otherwise"""
+
+    initargs = (colour_enabled(), render, args)
+    if free_threaded():
+        init_worker(*initargs)
+        return ThreadPoolExecutor(jobs)
+    return ProcessPoolExecutor(jobs, initializer=init_worker, initargs=initargs)
+
+
+def read_batches(chunks: Iterator[list[str]], batches: queue.Queue):
+    """Reader thread, queues the lines of the stream in batches of at most
+    BATCH_LINES and ends with None"""
+
+    try:
+        for lines in chunks:
+            for i in range(0, len(lines), BATCH_LINES):
+                batches.put(lines[i : i + BATCH_LINES])
+    finally:
+        batches.put(None)
+
+
+def render_stream(
+    chunks: Iterator[list[str]], render: Renderer, args: Any, jobs: int
+) -> Iterator[list[str]]:
+    """Renders the lines of a stream, read as lists of lines, with `jobs`
+    workers, yielding the rendered lines of each batch in the original
+    order of the stream.
+
+    A reader thread splits the stream into batches as it is read, without
+    waiting for a batch to fill, the workers render them and the caller
+    writes out the results in order. At most `jobs * 2` batches are in
+    flight and as many wait to be rendered, past that the stream is no
+    longer read until the workers catch up.
+    """
+
+    batches: queue.Queue = queue.Queue(jobs * 2)
+    threading.Thread(target=read_batches, args=(chunks, batches), daemon=True).start()
+
+    with stream_pool(jobs, render, args) as pool:
+        pending: deque[Future] = deque()
+        reading = True
+        while reading or pending:
+            while pending and pending[0].done():
+                yield pending.popleft().result()
+
+            if pending and (not reading or len(pending) > jobs * 2):
+                yield pending.popleft().result()
+                continue
+            if not reading:
+                break
+
+            try:
+                batch = batches.get(timeout=POLL_INTERVAL if pending else None)
+            except queue.Empty:
+                continue
+            if batch is None:
+                reading = False
+            else:
+                pending.append(pool.submit(render_batch, batch))
+
+
+def use_parallel(spans: list[tuple[int, int]], jobs: int) -> bool:
+    """Whether the (start, end) ranges of a file to read are large enough to
+    be worth processing in parallel"""
+
+    return jobs > 1 and sum(end - start for start, end in spans) >= MIN_PARALLEL_SIZE
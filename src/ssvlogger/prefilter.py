@@ -0,0 +1,80 @@
+# pylint: disable=C0116, C0114
+
+"""Cheap checks on raw lines to drop ones that would never be printed,
+before they are tokenized, decoded or coloured"""
+
+from typing import Any
+
+from ssvlogger import dispatch
+from ssvlogger.record import split_fields
+
+
+def is_silent(component: str, message: str) -> bool:
+    if (index := dispatch.find_component(component)) is None:
+        return False
+    entry = index.lookup(message)
+    return entry is not None and entry[1]
+
+
+def keep_line(line: str, args: Any) -> bool:
+    """Returns False for docker or journal lines that are filtered out
+    by the verbose and silent flags"""
+
+    if args.verbose and not args.silent:
+        return True
+
+    fields = split_fields(line, 4 if args.silent else 2)
+
+    if len(fields) < 2:
+        return True
+    if fields[1] == "DEBUG":  # Verbose mode prints debug logs as-is
+        return args.verbose
+
+    return not (args.silent and len(fields) == 4 and is_silent(fields[2], fields[3]))
+
+
+def json_string(line: str, key: str, end: int = -1) -> str | None:
+    """Returns the value of a top level string key in a JSON log line,
+    None if it is missing or needs unescaping"""
+
+    start = line.find(f'"{key}":"', 0, end if end >= 0 else len(line))
+    if start < 0:
+        return None
+    start += len(key) + 4
+    stop = line.find('"', start)
+    if stop < 0 or "\\" in (value := line[start:stop]):
+        return None
+    return value
+
+
+def keep_json(line: str, args: Any) -> bool:
+    """Same as keep_line for lines of the node's JSON log file, zap writes
+    the level, time, name and message keys ahead of any other field"""
+
+    if args.verbose and not args.silent:
+        return True
+
+    if json_string(line, "L") == "DEBUG":
+        return args.verbose
+
+    if args.silent and (message := json_string(line, "M")) is not None:
+        mpos = line.find('"M":"')
+        if (component := json_string(line, "N", mpos)) is not None:
+            return not is_silent(component, message)
+
+    return True
+
+
+def item_time(item: Any, fmt: str) -> str | None:
+    """Returns the timestamp of a line or journal entry as a string which
+    sorts in time order, or None if it has none"""
+
+    if fmt == "json":
+        return json_string(item, "T")
+    if fmt in ("journal-json", "journal-export"):
+        return item.get("__REALTIME_TIMESTAMP")
+
+    time = split_fields(item, 1)[0]
+    if fmt == "journal":  # Skip the syslog prefix, `host ssv[pid]: `
+        time = time.partition(": ")[2]
+    return time if time[:1].isdigit() else None
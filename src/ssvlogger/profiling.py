@@ -0,0 +1,70 @@
+# pylint: disable=C0116, C0114
+
+"""Per-matcher call counts and timings for --profile"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, TextIO
+
+
+@dataclass(slots=True)
+class MatcherStats:
+    """Counters for a single matcher"""
+
+    calls: int = 0
+    total: int = 0
+    failures: int = 0
+
+
+class Profiler:
+    """Records how often each matcher runs, how long it takes and how often
+    it raises (sending the line to the raw fallback)"""
+
+    def __init__(self):
+        self.matchers: dict[tuple[str, str], MatcherStats] = {}
+        self.unmatched: dict[str, int] = {}
+
+    def call(self, key: tuple[str, str], func: Callable, *args: Any) -> Any:
+        """Calls `func(*args)`, recording its timing under `key`, which is
+        a (component, matcher key) pair"""
+
+        if (stats := self.matchers.get(key)) is None:
+            stats = self.matchers[key] = MatcherStats()
+
+        stats.calls += 1
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        except Exception:
+            stats.failures += 1
+            raise
+        finally:
+            stats.total += time.perf_counter_ns() - start
+
+    def miss(self, component: str):
+        """Records a line of a known component that no matcher handled"""
+
+        self.unmatched[component] = self.unmatched.get(component, 0) + 1
+
+    def report(self, out: TextIO):
+        rows = sorted(self.matchers.items(), key=lambda i: i[1].total, reverse=True)
+
+        out.write(
+            f"\n{'component':<24} {'matcher':<48} {'calls':>9} "
+            + f"{'total ms':>10} {'mean us':>9} {'failed':>7}\n"
+        )
+        for (component, key), stats in rows:
+            out.write(
+                f"{component:<24.24} {key:<48.48} {stats.calls:>9} "
+                + f"{stats.total / 1e6:>10.2f} {stats.total / stats.calls / 1e3:>9.2f} "
+                + f"{stats.failures:>7}\n"
+            )
+
+        if self.unmatched:
+            out.write(f"\n{'component':<24} {'unmatched':>9}\n")
+            for component, count in sorted(
+                self.unmatched.items(), key=lambda i: i[1], reverse=True
+            ):
+                out.write(f"{component:<24.24} {count:>9}\n")
+
+        out.flush()
@@ -0,0 +1,79 @@
+# pylint: disable=C0116, C0114
+
+"""Chunked line reader for stdin and log files"""
+
+import codecs
+from typing import BinaryIO, Iterator
+
+# Bytes requested per read, a single read returns less on a live pipe
+CHUNK_SIZE = 1024 * 1024
+
+
+class LineDecoder:
+    """Incrementally decodes chunks of bytes into complete lines, keeping a
+    line (or multi-byte character) cut off at the end of a chunk until the
+    rest of it arrives"""
+
+    __slots__ = ("decoder", "partial")
+
+    def __init__(self):
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.partial = ""
+
+    def feed(self, data: bytes | memoryview) -> list[str]:
+        lines = (self.partial + self.decoder.decode(data)).split("\n")
+        self.partial = lines.pop()
+        return lines
+
+    def finish(self) -> list[str]:
+        """Returns the incomplete last line, if any, and resets the decoder"""
+
+        partial = self.partial + self.decoder.decode(b"", final=True)
+        self.decoder.reset()
+        self.partial = ""
+        return [partial] if partial else []
+
+
+def iter_line_chunks(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[list[str]]:
+    """Yields the complete lines of each read from a binary stream, without
+    their line endings.
+
+    Data is read with `readinto` into one reusable buffer and each chunk
+    is decoded and split in bulk. `stream` should be unbuffered (e.g.
+    `sys.stdin.buffer.raw`) so reads return as soon as data is available.
+    """
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    decoder = LineDecoder()
+
+    while n := stream.readinto(buffer):
+        if lines := decoder.feed(view[:n]):
+            yield lines
+
+    if lines := decoder.finish():
+        yield lines
+
+
+def iter_lines(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yields the lines of a binary stream without their line endings"""
+
+    for lines in iter_line_chunks(stream, chunk_size):
+        yield from lines
+
+
+def iter_file_lines(
+    path: str, start: int, end: int, chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """Yields the lines of the bytes `start` to `end` of a file"""
+
+    decoder = LineDecoder()
+
+    with open(path, "rb", buffering=0) as inp:
+        inp.seek(start)
+        remaining = end - start
+        while remaining > 0 and (data := inp.read(min(chunk_size, remaining))):
+            remaining -= len(data)
+            yield from decoder.feed(data)
+
+    yield from decoder.finish()
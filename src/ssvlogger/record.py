@@ -0,0 +1,183 @@
+# pylint: disable=C0116, C0114
+
+"""Structured representation of a single SSV log line"""
+
+import itertools
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from ssvlogger.common import JSONDecodeError, loads
+
+SEPARATOR = "        "
+
+# The zap timestamp at the start of docker and `journalctl --output cat`
+# lines
+ZAP_TIME = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d")
+
+# Lines looked at to detect the format of a stream
+DETECT_LINES = 16
+
+
+@dataclass(slots=True)
+class LogRecord:
+    """An SSV log line, tokenized and decoded exactly once.
+
+    `fields` holds the decoded structured fields of the line, `raw` the
+    undecoded text they came from (used when falling back to printing the
+    line as-is).
+    """
+
+    time: str
+    level: str
+    component: str | None
+    message: str
+    fields: dict[str, Any]
+    raw: str | None = None
+
+    def text(self) -> str:
+        """Returns the record without time and level, as printed by the node"""
+
+        parts = [self.message]
+        if self.component is not None:
+            parts.insert(0, self.component)
+        if self.raw is not None:
+            parts.append(self.raw)
+        return SEPARATOR.join(parts)
+
+
+def split_fields(line: str, count: int = -1) -> list[str]:
+    """Splits a docker or journal line into its fields in one pass,
+    accepting both tab and 8 space separators. With a `count` only up to
+    that many leading fields are returned, without splitting the rest."""
+
+    if count < 0:  # Lines use one kind of separator, split them in C
+        if SEPARATOR not in line:
+            return line.split("\t")
+        if "\t" not in line:
+            return line.split(SEPARATOR)
+
+    fields = []
+    pos = 0
+    spaces = 0
+
+    while len(fields) != count:
+        tab = line.find("\t", pos)
+        if spaces >= 0:  # Stop looking once a line has no space separators
+            spaces = line.find(SEPARATOR, pos)
+
+        if tab < 0 and spaces < 0:
+            fields.append(line[pos:].rstrip())
+            break
+
+        if spaces < 0 or 0 <= tab < spaces:
+            fields.append(line[pos:tab])
+            pos = tab + 1
+        else:
+            fields.append(line[pos:spaces])
+            pos = spaces + len(SEPARATOR)
+
+    return fields
+
+
+def line_format(line: str) -> str | None:
+    """Returns the format of a line by --input: json for the node's JSON
+    logs, journal-json for `journalctl -o json`, docker for zap console
+    lines as printed by docker or `journalctl --output cat` and journal for
+    those behind the syslog prefix of journalctl. None if the line does not
+    tell."""
+
+    line = line.lstrip()
+    if line.startswith("{"):
+        return "journal-json" if '"MESSAGE":' in line else "json"
+    if ZAP_TIME.match(line):
+        return "docker"
+    prefix, sep, rest = line.partition(": ")
+    if sep and ZAP_TIME.match(rest) and "\t" not in prefix:
+        return "journal"
+    return None
+
+
+def detect_format(chunks: Iterable[list[str]]) -> tuple[str | None, Iterator[list[str]]]:
+    """Detects the format of a stream of lists of lines from its first
+    lines, reading no further than needed. Returns the format, None if
+    the first DETECT_LINES lines do not tell, and the stream with the
+    lists read put back."""
+
+    chunks = iter(chunks)
+    head = []
+    seen = 0
+
+    for lines in chunks:
+        head.append(lines)
+        for line in lines[: DETECT_LINES - seen]:
+            if (fmt := line_format(line)) is not None:
+                return fmt, itertools.chain(head, chunks)
+        if (seen := seen + len(lines)) >= DETECT_LINES:
+            break
+
+    return None, itertools.chain(head, chunks)
+
+
+def decode_fields(raw: str) -> dict[str, Any]:
+    try:
+        fields = loads(raw)
+    except JSONDecodeError:
+        return {}
+    return fields if isinstance(fields, dict) else {}
+
+
+def parse_line(line: str) -> LogRecord | None:
+    """Parses a line as printed by docker or journalctl"""
+
+    if "systemd[1]" in line:  # Ignore systemd messages
+        return None
+
+    log = split_fields(line.strip())
+
+    if len(log) < 2:  # Ignore any non standard messages
+        return None
+
+    component = None
+    fields = {}
+    raw = None
+
+    if len(log) >= 5:
+        component, message = log[2], log[3]
+        fields = decode_fields(log[4])
+        raw = SEPARATOR.join(log[4:])
+    elif len(log) == 4 and log[3].startswith("{"):
+        message, raw = log[2], log[3]
+        fields = decode_fields(raw)
+    elif len(log) == 4:
+        component, message = log[2], log[3]
+    else:
+        message = log[2] if len(log) == 3 else ""
+
+    return LogRecord(log[0], log[1], component, message, fields, raw)
+
+
+def parse_json(line: str) -> LogRecord | None:
+    """Parses a line of the node's JSON log file"""
+
+    try:
+        data = loads(line)
+    except JSONDecodeError:  # Ignore any non standard messages
+        return None
+    return json_record(data, line)
+
+
+def json_record(data: Any, line: str) -> LogRecord | None:
+    """Returns the LogRecord of the decoded JSON log `line`, None unless
+    it is an object with string T, L and M keys and a string N, if any"""
+
+    # A line cut short by following or truncation can still be valid JSON
+    if not isinstance(data, dict):
+        return None
+    time, level, message = data.get("T"), data.get("L"), data.get("M")
+    if not (isinstance(time, str) and isinstance(level, str) and isinstance(message, str)):
+        return None
+    if (component := data.get("N")) is not None and not isinstance(component, str):
+        return None
+
+    return LogRecord(time, level, component, message, data, line.strip())
@@ -0,0 +1,88 @@
+# pylint: disable=C0116, C0114
+
+"""Colouring of rendered logs.
+
+Matchers build their output from templates, format strings in which
+colours are written as `{GREEN}` ... `{RESET}`. Each template is compiled
+once per renderer with the colours filled in, leaving only the fields of
+the log to format per line. The ANSI renderer fills in escape codes, the
+plain renderer (used when stdout is not a terminal or NO_COLOR is set)
+fills in nothing. The plain renderer is active until use_renderer(True)
+is called, so rendering is plain when ssvlogger is used as a library.
+"""
+
+import re
+
+# Same codes as colorama.Fore
+ANSI = {
+    "BLUE": "\x1b[34m",
+    "CYAN": "\x1b[36m",
+    "GREEN": "\x1b[32m",
+    "LIGHTBLACK_EX": "\x1b[90m",
+    "LIGHTBLUE_EX": "\x1b[94m",
+    "LIGHTCYAN_EX": "\x1b[96m",
+    "LIGHTMAGENTA_EX": "\x1b[95m",
+    "LIGHTRED_EX": "\x1b[91m",
+    "MAGENTA": "\x1b[35m",
+    "RED": "\x1b[31m",
+    "RESET": "\x1b[39m",
+    "YELLOW": "\x1b[33m",
+}
+
+PLAIN = dict.fromkeys(ANSI, "")
+
+COLOUR = re.compile(r"\{(" + "|".join(ANSI) + r")\}")
+
+
+class Fore:  # pylint: disable=too-few-public-methods
+    """Colour codes of the active renderer, named as in colorama.Fore, for
+    output that is not built from a template"""
+
+    BLUE = ""
+    CYAN = ""
+    GREEN = ""
+    LIGHTBLACK_EX = ""
+    LIGHTBLUE_EX = ""
+    LIGHTCYAN_EX = ""
+    LIGHTMAGENTA_EX = ""
+    LIGHTRED_EX = ""
+    MAGENTA = ""
+    RED = ""
+    RESET = ""
+    YELLOW = ""
+
+
+class Template:  # pylint: disable=too-few-public-methods
+    """A message template, `format(**fields)` formats it with the colours
+    of the active renderer"""
+
+    __slots__ = ("text", "format")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.compile(ANSI if Fore.RESET else PLAIN)
+
+    def compile(self, colours: dict[str, str]):
+        self.format = COLOUR.sub(lambda m: colours[m[1]], self.text).format
+
+
+TEMPLATES: list[Template] = []
+
+
+def template(text: str) -> Template:
+    TEMPLATES.append(compiled := Template(text))
+    return compiled
+
+
+def use_renderer(colour: bool):
+    """Switches between the ANSI (`colour`) and the plain renderer"""
+
+    colours = ANSI if colour else PLAIN
+    for name, code in colours.items():
+        setattr(Fore, name, code)
+    for compiled in TEMPLATES:
+        compiled.compile(colours)
+
+
+def colour_enabled() -> bool:
+    return bool(Fore.RESET)
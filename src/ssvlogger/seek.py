@@ -0,0 +1,78 @@
+# pylint: disable=C0116, C0114
+
+"""Finding the lines of a log file within a time range by binary search"""
+
+import mmap
+from datetime import datetime, timezone
+
+from ssvlogger.prefilter import item_time
+
+
+def parse_time(value: str) -> str:
+    """Validates a --since or --until time, returning it in the format zap
+    writes times in so that it compares with them as a string. zap writes
+    UTC, so a time with an offset is converted to UTC."""
+
+    parsed = datetime.fromisoformat(value)  # Raises ValueError when malformed
+    if parsed.tzinfo is None:
+        return value.replace(" ", "T")
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def line_start(mm: mmap.mmap, pos: int) -> int:
+    """Returns the offset of the first line starting at or after `pos`"""
+
+    if pos == 0 or mm[pos - 1] == ord("\n"):
+        return pos
+    newline = mm.find(b"\n", pos)
+    return len(mm) if newline < 0 else newline + 1
+
+
+def first_time(mm: mmap.mmap, pos: int, fmt: str) -> tuple[int, str | None]:
+    """Returns the offset and timestamp of the first line with one from
+    `pos` on, the end of the file and None if there is none"""
+
+    size = len(mm)
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end < 0:
+            end = size
+        if time := item_time(mm[pos:end].decode("utf-8", errors="replace"), fmt):
+            return pos, time
+        pos = end + 1
+    return size, None
+
+
+def find_offset(mm: mmap.mmap, time: str, fmt: str) -> int:
+    """Returns the offset of the first line logged at or after `time`.
+
+    Lines are expected to be in time order, each step reads a single line
+    so finding the offset takes O(log n) reads of the file. Lines without
+    a timestamp go with the line before them, so they are kept with the
+    last line before `time` rather than the first one after it.
+    """
+
+    lo, hi = 0, len(mm)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        found = first_time(mm, line_start(mm, mid), fmt)[1]
+        if found is None or found >= time:
+            hi = mid
+        else:
+            lo = mid + 1
+    return first_time(mm, line_start(mm, lo), fmt)[0]
+
+
+def time_range(
+    path: str, fmt: str, since: str | None, until: str | None
+) -> tuple[int, int]:
+    """Returns the (start, end) offsets of the lines of a log file logged
+    from `since` up to, but not including, `until`"""
+
+    with open(path, "rb") as inp:
+        if not (size := inp.seek(0, 2)):
+            return 0, 0
+        with mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0 if since is None else find_offset(mm, since, fmt)
+            end = size if until is None else find_offset(mm, until, fmt)
+    return start, max(start, end)
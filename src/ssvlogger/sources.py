@@ -0,0 +1,161 @@
+# pylint: disable=C0116, C0114
+
+"""Reading several live sources (files, FIFOs and commands such as
+`docker logs -f NODE`) concurrently with asyncio, for --source and
+--command"""
+
+import asyncio
+import os
+import shlex
+import stat
+import sys
+import threading
+from typing import Any, AsyncIterator
+
+from ssvlogger.follow import follow_chunks
+from ssvlogger.reader import CHUNK_SIZE, LineDecoder
+
+# Most lines a source hands over at a time, so that a busy source waits
+# its turn behind the others instead of flooding the output
+BATCH_LINES = 64
+
+# Batches waiting to be rendered, a source reading further blocks until
+# there is room
+QUEUE_SIZE = 64
+
+# (name, kind, target), kind being "file" (a file or FIFO) or "command"
+Source = tuple[str, str, str]
+
+
+def parse_source(spec: str, kind: str) -> Source:
+    """Parses `[NAME=]PATH` or `[NAME=]COMMAND`. Without a name a file is
+    named after its file name and a command after its last argument, e.g.
+    `docker logs -f ssv1` is named ssv1."""
+
+    name, sep, target = spec.partition("=")
+    if not sep or not name or any(c in name for c in " /"):
+        name, target = "", spec
+
+    if kind == "command":
+        if not (args := shlex.split(target)):
+            raise ValueError(f"Empty command in {spec}")
+        name = name or os.path.basename(args[-1])
+    else:
+        name = name or os.path.basename(target)
+
+    return name, kind, target
+
+
+def batches(lines: list[Any]) -> list[list[Any]]:
+    return [lines[i : i + BATCH_LINES] for i in range(0, len(lines), BATCH_LINES)]
+
+
+async def read_stream(index: int, stream: asyncio.StreamReader, queue: asyncio.Queue):
+    decoder = LineDecoder()
+    while data := await stream.read(CHUNK_SIZE):
+        for batch in batches(decoder.feed(data)):
+            await queue.put((index, batch))
+            await asyncio.sleep(0)  # Let the other sources take their turn
+    if lines := decoder.finish():
+        await queue.put((index, lines))
+
+
+async def read_command(index: int, command: str, queue: asyncio.Queue):
+    """Reads the output of a command, stdout and stderr alike as docker
+    logs writes the node's stderr to its own"""
+
+    process = await asyncio.create_subprocess_exec(
+        *shlex.split(command),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    try:
+        await read_stream(index, process.stdout, queue)
+    finally:
+        if process.returncode is None:
+            process.terminate()
+        await process.wait()
+
+
+async def read_pipe(index: int, path: str, queue: asyncio.Queue):
+    """Reads a FIFO until its writers close it"""
+
+    loop = asyncio.get_running_loop()
+    # Opening a FIFO blocks until a writer opens it too
+    pipe = await asyncio.to_thread(open, path, "rb", buffering=0)
+    stream = asyncio.StreamReader(limit=CHUNK_SIZE)
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(stream), pipe
+    )
+    try:
+        await read_stream(index, stream, queue)
+    finally:
+        transport.close()
+
+
+async def read_file(index: int, path: str, queue: asyncio.Queue):
+    """Follows a file like --follow. follow_chunks blocks, so it runs in a
+    thread which waits for room in the queue before reading on."""
+
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+
+    def run():
+        try:
+            for lines in follow_chunks(path):
+                for batch in batches(lines):
+                    asyncio.run_coroutine_threadsafe(queue.put((index, batch)), loop).result()
+        except RuntimeError:  # The loop closed
+            return
+        except OSError as error:
+            loop.call_soon_threadsafe(done.set_exception, error)
+
+    threading.Thread(target=run, daemon=True).start()
+    await done
+
+
+async def read_source(index: int, source: Source, queue: asyncio.Queue):
+    """Reads a source into the queue, ending with (index, None)"""
+
+    name, kind, target = source
+    try:
+        if kind == "command":
+            await read_command(index, target, queue)
+        elif stat.S_ISREG(os.stat(target).st_mode):
+            await read_file(index, target, queue)
+        else:
+            await read_pipe(index, target, queue)
+    except OSError as error:
+        print(f"SSVLogger Error: {name}: {error}", file=sys.stderr)
+    await queue.put((index, None))
+
+
+async def interleave(sources: list[Source]) -> AsyncIterator[tuple[int, list[str]]]:
+    """Yields (index of the source, lines) as the sources produce lines,
+    until all of them have ended.
+
+    Each source hands over at most BATCH_LINES lines at a time through one
+    bounded queue and lets the other sources run after each batch. Sources
+    waiting for room are let in in the order they started waiting, so busy
+    sources take turns rather than one of them holding up the rest.
+    """
+
+    queue: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+    tasks = [
+        asyncio.create_task(read_source(index, source, queue))
+        for index, source in enumerate(sources)
+    ]
+
+    try:
+        running = len(tasks)
+        while running:
+            index, lines = await queue.get()
+            if lines is None:
+                running -= 1
+            elif lines:
+                yield index, lines
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
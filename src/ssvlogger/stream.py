@@ -0,0 +1,223 @@
+# pylint: disable=C0116, C0114
+
+"""Rendering logs into Records, independent of the command line"""
+
+from typing import Any, Callable, Iterable, Iterator
+
+from ssvlogger import dispatch
+from ssvlogger import journal as journalctl
+from ssvlogger.common import JSONDecodeError
+from ssvlogger.matches.root import Root
+from ssvlogger.prefilter import keep_json, keep_line
+from ssvlogger.record import LogRecord, detect_format, parse_json, parse_line
+from ssvlogger.structured import Record, TrackedFields, matcher_id
+
+LEVELS = ("DEBUG", "INFO", "WARN", "ERROR", "DPANIC", "PANIC", "FATAL")
+
+# Formats parse_stream reads, journal-json being `journalctl -o json` and
+# auto any of the others, detected from the first lines
+STREAM_FORMATS = ("auto", "docker", "journal", "json", "journal-json")
+
+# Keys of the node's JSON logs that are already the time, level, component
+# and message of a Record
+RECORD_KEYS = ("T", "L", "N", "M")
+
+
+class Parser:
+    """Renders logs into Records with the given options.
+
+    `verbose` keeps debug logs, `silent` drops running logs such as peer
+    counts, `traceback` adds full tracebacks to errors and `journal` is
+    set for lines with a syslog prefix. Only logs of `levels` and
+    `components` are kept, when given. `profiler` times the matchers and
+    `key_fields` records the fields each matcher uses in Record.fields.
+
+    Parsers keep their own options, but render through the process wide
+    renderer of render.use_renderer. A Parser is not thread-safe.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        verbose: bool = False,
+        silent: bool = False,
+        traceback: bool = False,
+        journal: bool = False,
+        levels: set[str] | None = None,
+        components: set[str] | None = None,
+        profiler: Any = None,
+        key_fields: bool = True,
+    ):
+        self.verbose = verbose
+        self.silent = silent
+        self.traceback = traceback
+        self.journal = journal
+        self.filter = (levels, components)
+        self.profiler = profiler
+        self.key_fields = key_fields
+
+    def accepts(self, log: LogRecord) -> bool:
+        """Returns whether a log passes the level and component filters"""
+
+        levels, components = self.filter
+        if levels is not None and log.level not in levels:
+            return False
+        return components is None or log.component in components
+
+    def parse(self, log: LogRecord | None) -> Record | None:
+        """Returns the Record of a log, None if it is not shown"""
+
+        if log is None or not self.accepts(log):
+            return None
+        if log.level == "DEBUG" and not self.verbose:
+            return None
+        return self.render(log)
+
+    def parse_line(self, line: str) -> Record | None:
+        """Parses a line as printed by docker or journalctl"""
+
+        if keep_line(line, self):
+            return self.parse(parse_line(line))
+        return None
+
+    def parse_json_line(self, line: str) -> Record | None:
+        """Parses a line of the node's JSON log file"""
+
+        if line and keep_json(line, self):
+            return self.parse(parse_json(line))
+        return None
+
+    def parse_entry(self, entry: dict[str, Any]) -> Record | None:
+        """Parses an entry of `journalctl -o json` or `journalctl -o export`"""
+
+        if journalctl.is_systemd(entry) or (line := journalctl.message(entry)) is None:
+            return None
+        if not (keep_json if line.startswith("{") else keep_line)(line, self):
+            return None
+        return self.parse(journalctl.parse_entry(entry, line))
+
+    def find_matcher(
+        self, log: LogRecord
+    ) -> tuple[Callable | None, bool, bool, tuple, tuple] | None:
+        """Returns the matcher of a log, whether it is silent, whether it is
+        a Root matcher, its profiler key and the arguments it takes, which
+        are (log, self) for a Root matcher and (log,) for the matcher of a
+        table. The matcher is None for a log of a known component without
+        one, and None is returned for any other log without one."""
+
+        component = log.component
+        if component is not None and (
+            index := dispatch.find_component(component)
+        ) is not None:
+            if (key := index.find(log.message)) is None:
+                if self.profiler is not None:
+                    self.profiler.miss(component)
+                return None, False, False, (), ()
+            f, silent = index.table[key]
+            return f, silent, False, (component, key), (log,)
+
+        # Edge case logs that don't belong to a specific module
+        for root_name, (test, f) in Root.items():
+            if test(log):
+                return f, False, True, ("switch_log", root_name), (log, self)
+        return None
+
+    def render(self, log: LogRecord) -> Record | None:
+        """Renders a log with its matcher, regardless of the filters, None
+        if the matcher drops it"""
+
+        if (found := self.find_matcher(log)) is None:
+            return None
+        f, silent, root, name, call = found
+        if f is None:
+            return self.record(log, None, log.text(), [])
+
+        if self.key_fields:
+            log.fields = TrackedFields(log.fields)
+
+        try:
+            if self.profiler is not None:
+                x = self.profiler.call(name, f, *call)
+            else:
+                x = f(*call)
+        except (JSONDecodeError, IndexError, KeyError):
+            return self.record(log, None, log.text(), [])
+
+        if (self.silent and silent) or (x is None):
+            return None
+
+        # A table matcher without a message shows the log as-is, while a
+        # Root matcher may print nothing
+        if x[0] == "" and not root:
+            return self.record(log, f, log.text(), x[1])
+        return self.record(log, f, x[0], x[1])
+
+    def record(self, log: LogRecord, f: Any, message: str, details: list[str]) -> Record:
+        fields = log.fields
+        if isinstance(fields, TrackedFields):
+            fields = {k: v for k, v in fields.read.items() if k not in RECORD_KEYS}
+        else:
+            fields = {}
+
+        return Record(
+            time=log.time.partition(": ")[2] if self.journal else log.time,
+            matcher=None if f is None else matcher_id(f),
+            message=message,
+            details=details,
+            fields=fields,
+            log=log,
+        )
+
+
+def parse_stream(  # pylint: disable=too-many-arguments
+    lines: Iterable[str],
+    *,
+    input_format: str = "docker",
+    verbose: bool = False,
+    silent: bool = False,
+    traceback: bool = False,
+    level: str | None = None,
+    components: Iterable[str] | None = None,
+) -> Iterator[Record]:
+    """Yields a Record for each log of `lines` that ssvlogger would show.
+
+    `input_format` is one of STREAM_FORMATS, `level` the lowest level
+    shown and `components` the only components shown. Nothing is printed
+    and each stream has its own Parser, so several can be parsed one after
+    another or interleaved in one thread. Colours follow the process wide
+    renderer (plain unless render.use_renderer(True) was called) and the
+    matcher tables are shared, so streams are not to be parsed from
+    several threads. For example:
+
+        with open("ssv.log", encoding="utf-8") as inp:
+            for record in parse_stream(inp, input_format="json"):
+                ship(record.to_dict())
+    """
+
+    if input_format not in STREAM_FORMATS:
+        raise ValueError(f"Unknown input format {input_format}")
+
+    if input_format == "auto":
+        fmt, chunks = detect_format([line] for line in lines)
+        input_format = fmt or "docker"
+        lines = (line for chunk in chunks for line in chunk)
+
+    parser = Parser(
+        verbose=verbose,
+        silent=silent,
+        traceback=traceback,
+        journal=input_format == "journal",
+        levels=None if level is None else set(LEVELS[LEVELS.index(level.upper()) :]),
+        components=None if components is None else set(components),
+    )
+
+    if input_format == "journal-json":
+        items: Iterable[Any] = journalctl.json_entries(lines)
+        parse = parser.parse_entry
+    else:
+        items = lines
+        parse = parser.parse_json_line if input_format == "json" else parser.parse_line
+
+    for item in items:
+        if (record := parse(item)) is not None:
+            yield record
@@ -0,0 +1,103 @@
+# pylint: disable=C0116, C0114
+
+"""Structured form of rendered logs, as yielded by parse_stream and
+written by --output json"""
+
+import functools
+from dataclasses import dataclass
+from typing import Any, ItemsView, Iterator, KeysView, ValuesView
+
+from ssvlogger.record import LogRecord
+
+
+@dataclass(slots=True)
+class Record:
+    """A log rendered by its matcher.
+
+    `message` is the human readable message and `details` any further lines
+    of it, both in the colours of the active renderer (plain unless
+    use_renderer(True) was called). `matcher` names the matcher that
+    rendered the log, None if it was shown as-is, and `fields` holds the
+    fields of the log the matcher used. `log` is the parsed log itself,
+    which the level and component are read from.
+    """
+
+    time: str
+    matcher: str | None
+    message: str
+    details: list[str]
+    fields: dict[str, Any]
+    log: LogRecord
+
+    @property
+    def level(self) -> str:
+        return self.log.level
+
+    @property
+    def component(self) -> str | None:
+        return self.log.component
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the record as a JSON serializable dict, leaving out
+        empty details and fields"""
+
+        event = {
+            "time": self.time,
+            "level": self.level,
+            "component": self.component,
+            "matcher": self.matcher,
+            "message": self.message,
+        }
+        if self.details:
+            event["details"] = self.details
+        if self.fields:
+            event["fields"] = self.fields
+        return event
+
+
+class TrackedFields(dict):
+    """The fields of a log, remembering the ones a matcher reads so they
+    can be output as the key fields of the log. A matcher iterating the
+    fields reads all of them."""
+
+    __slots__ = ("read",)
+
+    def __init__(self, fields: dict[str, Any]):
+        super().__init__(fields)
+        self.read: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        self.read[key] = value
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def read_all(self):
+        self.read.update(dict.items(self))
+
+    def __iter__(self) -> Iterator[str]:
+        self.read_all()
+        return super().__iter__()
+
+    def keys(self) -> KeysView[str]:
+        self.read_all()
+        return super().keys()
+
+    def values(self) -> ValuesView[Any]:
+        self.read_all()
+        return super().values()
+
+    def items(self) -> ItemsView[str, Any]:
+        self.read_all()
+        return super().items()
+
+
+@functools.cache
+def matcher_id(func: Any) -> str:
+    """Names a matcher by its module and function, e.g. consensus.connected"""
+
+    return f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
@@ -0,0 +1,58 @@
+# pylint: disable=C0116, C0114
+
+import unittest
+
+from ssvlogger.dedup import Deduplicator
+from ssvlogger.record import LogRecord
+
+
+class DeduplicatorTest(unittest.TestCase):
+    """Messages repeated within the window are counted, not printed"""
+
+    def setUp(self):
+        self.deduper = Deduplicator(window=60, size=3)
+
+    def check(self, second: int, message: str, level: str = "INFO") -> tuple[bool, list[str]]:
+        time = f"2024-05-01T10:{second // 60:02d}:{second % 60:02d}.000000Z"
+        record = LogRecord(time, level, "P2PNetwork", message, {})
+        return self.deduper.check(record, f"{second} ", message)
+
+    def test_repeats(self):
+        self.assertEqual(self.check(0, "peers: 5"), (True, []))
+        self.assertEqual(self.check(10, "peers: 6"), (False, []))  # Numbers are ignored
+        self.assertEqual(self.check(20, "peers: 7"), (False, []))
+        self.assertEqual(
+            self.check(70, "other"),
+            (True, ["20 last message repeated 2 times: peers: 5"]),
+        )
+
+    def test_window_from_first_print(self):
+        self.check(0, "peers: 5")
+        self.check(50, "peers: 5")
+        self.assertEqual(
+            self.check(61, "peers: 5"),
+            (True, ["50 last message repeated 1 times: peers: 5"]),
+        )
+
+    def test_level(self):
+        self.check(0, "boom")
+        self.assertEqual(self.check(1, "boom", "ERROR"), (True, []))
+
+    def test_size(self):
+        self.check(0, "a")
+        self.check(1, "a")
+        self.check(2, "b")
+        self.check(3, "c")
+        # Forgetting the least recently seen message reports its repeats
+        self.assertEqual(self.check(4, "d"), (True, ["1 last message repeated 1 times: a"]))
+
+    def test_flush(self):
+        self.check(0, "a\nsecond line")
+        self.check(1, "a\nsecond line")  # Reported by its first line
+        self.check(2, "b")
+        self.assertEqual(self.deduper.flush(), ["1 last message repeated 1 times: a"])
+        self.assertEqual(self.deduper.flush(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# pylint: disable=C0116, C0114
+
+import os
+import tempfile
+import unittest
+
+from ssvlogger.follow import follow_chunks
+
+
+class FollowTest(unittest.TestCase):
+    """follow_chunks reads appended lines across rotation and truncation.
+    Lines are written before they are read, so each read returns without
+    waiting on the file, and the file is opened by reading its first line."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.dir.name, "ssv.log")
+        self.write("old\n")
+        self.lines = follow_chunks(self.path, from_start=True, poll_interval=0.01)
+        self.assertEqual(self.read(1), ["old"])
+
+    def tearDown(self):
+        self.lines.close()
+        self.dir.cleanup()
+
+    def write(self, text: str, mode: str = "a"):
+        with open(self.path, mode, encoding="utf-8") as out:
+            out.write(text)
+
+    def read(self, count: int) -> list[str]:
+        lines: list[str] = []
+        while len(lines) < count:
+            lines.extend(next(self.lines))
+        return lines
+
+    def test_append(self):
+        self.write("a\nb")
+        self.assertEqual(self.read(1), ["a"])
+        self.write("c\n")  # Completes the partial line
+        self.assertEqual(self.read(1), ["bc"])
+
+    def test_rotation(self):
+        self.write("a\n")
+        self.assertEqual(self.read(1), ["a"])
+
+        self.write("b\nlast")  # Written to the old file before it is replaced
+        os.rename(self.path, self.path + ".1")
+        self.write("c\n", "w")
+        self.assertEqual(self.read(3), ["b", "last", "c"])
+
+    def test_truncation(self):
+        self.write("a\nb\n")
+        self.assertEqual(self.read(2), ["a", "b"])
+
+        self.write("c\n", "w")  # Shorter than what was read
+        self.assertEqual(self.read(1), ["c"])
+
+    def test_created_later(self):
+        os.remove(self.path)
+        self.write("a\n")
+        self.assertEqual(self.read(1), ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
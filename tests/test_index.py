@@ -0,0 +1,107 @@
+# pylint: disable=C0116, C0114
+
+import argparse
+import json
+import os
+import tempfile
+import unittest
+
+from ssvlogger.index import INDEX_SUFFIX, load_index, select_spans
+
+
+T0, T1 = "2024-05-01T10:00:00.000000Z", "2024-05-01T10:01:00.000000Z"
+
+
+def log(time: str, level: str, component: str) -> str:
+    return f"{time}\t{level}\t{component}\tmessage\n"
+
+
+FIRST = log(T0, "INFO", "P2PNetwork") + log(T0, "DEBUG", "Controller")
+SECOND = log(T1, "ERROR", "Controller")
+
+
+class IndexTest(unittest.TestCase):
+    """The sidecar index is reused, extended or rebuilt as the file changes"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.write(FIRST + SECOND, "w")
+
+    def tearDown(self):
+        for path in (self.path, self.path + INDEX_SUFFIX):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write(self, text: str, mode: str = "a"):
+        with open(self.path, mode, encoding="utf-8") as out:
+            out.write(text)
+        # Each write is seen as a change, however close together they are
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def blocks(self) -> list[list]:
+        return [block[2:] for block in load_index(self.path, "docker")["blocks"]]
+
+    def test_blocks(self):
+        self.assertEqual(
+            self.blocks(),
+            [
+                [T0, T0, ["DEBUG", "INFO"], ["Controller", "P2PNetwork"]],
+                [T1, T1, ["ERROR"], ["Controller"]],
+            ],
+        )
+        self.assertTrue(os.path.exists(self.path + INDEX_SUFFIX))
+
+    def test_reused(self):
+        index = load_index(self.path, "docker")
+        index["blocks"] = []  # Kept while the file is unchanged
+        with open(self.path + INDEX_SUFFIX, "w", encoding="utf-8") as out:
+            json.dump(index, out)
+        self.assertEqual(self.blocks(), [])
+
+    def test_rebuilt_when_corrupt(self):
+        with open(self.path + INDEX_SUFFIX, "w", encoding="utf-8") as out:
+            out.write("{")
+        self.assertEqual(len(self.blocks()), 2)
+
+    def test_extended(self):
+        self.blocks()
+        self.write(SECOND)
+        # Appended lines are indexed in blocks of their own, a rebuild would
+        # have added them to the last block
+        self.assertEqual(len(self.blocks()), 3)
+        self.assertEqual(load_index(self.path, "docker")["indexed"], os.path.getsize(self.path))
+
+    def test_rebuilt_when_replaced(self):
+        self.blocks()
+        self.write(SECOND + FIRST + FIRST, "w")  # Longer, but not appended to
+        self.assertEqual([block[:2] for block in self.blocks()], [[T1, T1], [T0, T0]])
+
+    def test_rebuilt_when_truncated(self):
+        self.blocks()
+        self.write(SECOND, "w")
+        self.assertEqual(len(self.blocks()), 1)
+
+    def test_rebuilt_for_another_format(self):
+        self.blocks()
+        self.assertEqual(load_index(self.path, "journal")["format"], "journal")
+
+    def test_select_spans(self):
+        index = load_index(self.path, "docker")
+        size = os.path.getsize(self.path)
+        first_end = len(FIRST.encode())
+
+        def spans(**filters):
+            filters = {"since": None, "until": None, "levels": None, "components": None, **filters}
+            return select_spans(index, (0, size), argparse.Namespace(**filters))
+
+        self.assertEqual(spans(), [(0, size)])
+        self.assertEqual(spans(levels={"ERROR"}), [(first_end, size)])
+        self.assertEqual(spans(components={"P2PNetwork"}), [(0, first_end)])
+        self.assertEqual(spans(since="2024-05-01T10:01"), [(first_end, size)])
+        self.assertEqual(spans(levels={"WARN"}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
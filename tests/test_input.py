@@ -0,0 +1,38 @@
+# pylint: disable=C0116, C0114
+
+import contextlib
+import io
+import unittest
+
+from ssvlogger import logger
+from ssvlogger.record import parse_line
+
+DOCKER = (
+    "2024-05-01T10:11:12.123456Z\tINFO\tConsensusClient\tconsensus client connected\t"
+    '{"address": "http://cl:5052"}'
+)
+
+
+class DetectInputTest(unittest.TestCase):
+    """Logs read from stdin are read in the format they are in"""
+
+    def test_journal_flag_on_docker_logs(self):
+        args = logger.parse_args(["-j"])
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            chunks = logger.detect_input(args, iter([[DOCKER]]))
+        self.assertIn("reading them as docker", stderr.getvalue())
+        self.assertEqual((args.input, args.journal, args.parser.journal), ("docker", False, False))
+
+        lines = [line for chunk in chunks for line in logger.render_line(chunk[0], args)]
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].startswith("2024-05-01 10:11:12 INFO: "))
+
+    def test_journal_time_without_prefix(self):
+        time, stat = logger.extract_time_and_stat(parse_line(DOCKER), False)
+        self.assertEqual(stat, "INFO")
+        self.assertNotIn("2024", time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# pylint: disable=C0116, C0114
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from ssvlogger.merge import expand_paths, merge_sources
+
+
+def log(second: int, message: str) -> str:
+    return f'{{"L":"INFO","T":"2024-05-01T10:11:{second:02d}.000000Z","M":"{message}"}}\n'
+
+
+class MergeTest(unittest.TestCase):
+    """merge_sources interleaves files in timestamp order"""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.dir.name, name)
+
+    def test_order(self):
+        with gzip.open(self.path("a.log.gz"), "wt", encoding="utf-8") as out:
+            out.write(log(1, "a1") + log(3, "a3") + "stray output\n" + log(5, "a5"))
+        with open(self.path("b.log"), "w", encoding="utf-8") as out:
+            out.write(log(2, "b2") + log(3, "b3") + log(4, "b4"))
+
+        merged = [
+            (index, json.loads(line)["M"] if line.startswith("{") else line)
+            for index, line in merge_sources([self.path("a.log.gz"), self.path("b.log")], "json")
+        ]
+        self.assertEqual(
+            merged,
+            [
+                (0, "a1"),
+                (1, "b2"),
+                (0, "a3"),  # Same time, in the order of the paths
+                (0, "stray output"),  # Follows the line before it
+                (1, "b3"),
+                (1, "b4"),
+                (0, "a5"),
+            ],
+        )
+
+    def test_expand_paths(self):
+        for name in ("b.log", "a.log"):
+            with open(self.path(name), "w", encoding="utf-8"):
+                pass
+        self.assertEqual(
+            expand_paths([self.path("*.log"), "x.log"]),
+            [self.path("a.log"), self.path("b.log"), "x.log"],
+        )
+        with self.assertRaises(FileNotFoundError):
+            expand_paths([self.path("*.gz")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# pylint: disable=C0116, C0114
+
+import unittest
+
+from ssvlogger import logger
+
+DOCKER = (
+    "2024-05-01T10:11:12.123456Z\tINFO\tController\trecording validator status\t"
+    '{"count": 4, "status": "active"}'
+)
+JSON = (
+    '{"L":"DEBUG","T":"2024-05-01T10:11:13.123456Z","N":"ConsensusClient",'
+    '"M":"consensus client connected","address":"http://cl:5052"}',
+    '{"L":"INFO","T":"2024-05-01T10:11:14.123456Z","N":"Controller",'
+    '"M":"recording validator status","count":2,"status":"exited"}',
+)
+
+
+def metrics(*flags: str) -> str:
+    args = logger.parse_args(["--metrics", "0", *flags])
+    logger.render_line(DOCKER, args)
+    for line in JSON:
+        logger.render_json_line(line, args)
+    return args.collector.render()
+
+
+class MetricsTest(unittest.TestCase):
+    """The metrics count every log, whatever is shown"""
+
+    def test_counts(self):
+        text = metrics()
+        self.assertIn('ssvlogger_logs_total{level="INFO"} 2', text)
+        self.assertIn('ssvlogger_logs_total{level="DEBUG"} 1', text)
+        self.assertIn('ssvlogger_consensus_client_events_total{event="connected"} 1', text)
+        self.assertIn('ssvlogger_validators{status="active"} 4', text)
+        self.assertIn('ssvlogger_validators{status="exited"} 2', text)
+
+    def test_display_flags(self):
+        text = metrics()
+        for flags in (["-s"], ["-v"], ["-s", "-v"], ["--output", "none"]):
+            with self.subTest(flags=flags):
+                self.assertEqual(metrics(*flags), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# pylint: disable=C0116, C0114
+
+import mmap
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ssvlogger import logger, parallel
+
+LINES = [
+    f"2024-05-01T10:11:{i % 60:02d}.000000Z\tINFO\tConsensusClient\t"
+    + ("consensus client connected" if i % 3 else "consensus client synced")
+    + f'\t{{"address": "http://cl{i}:5052"}}'
+    for i in range(3000)
+]
+
+
+def chunks(size: int):
+    return iter([LINES[i : i + size] for i in range(0, len(LINES), size)])
+
+
+class ParallelTest(unittest.TestCase):
+    """Logs rendered with --jobs come out in the order they were read"""
+
+    def setUp(self):
+        self.args = logger.parse_args([])
+        self.expected = [out for line in LINES for out in logger.render_line(line, self.args)]
+
+    def test_chunk_offsets(self):
+        data = "".join(line + "\n" for line in LINES).encode()
+        with tempfile.TemporaryFile() as inp:
+            inp.write(data)
+            inp.flush()
+            with mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                offsets = parallel.chunk_offsets(mm, 100, len(data), 1000)
+
+        self.assertEqual(offsets[0][0], 100)
+        self.assertEqual(offsets[-1][1], len(data))
+        for (_, end), (start, _) in zip(offsets, offsets[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1 : end], b"\n")
+
+    def test_render_file(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            out.writelines(line + "\n" for line in LINES)
+        self.addCleanup(os.remove, path)
+
+        offsets = parallel.chunk_offsets
+        with mock.patch.object(  # Many small chunks, so workers finish out of order
+            parallel, "chunk_offsets", lambda mm, start, end: offsets(mm, start, end, 4096)
+        ):
+            rendered = parallel.render_file(
+                path, logger.render_line, self.args, 4, [(0, os.path.getsize(path))]
+            )
+            self.assertEqual([line for lines in rendered for line in lines], self.expected)
+
+    def test_render_stream(self):
+        for threads in (False, True):
+            with self.subTest(threads=threads):
+                with mock.patch.object(parallel, "free_threaded", return_value=threads):
+                    rendered = parallel.render_stream(
+                        chunks(37), logger.render_line, self.args, 3
+                    )
+                    self.assertEqual(
+                        [line for lines in rendered for line in lines], self.expected
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
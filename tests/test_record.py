@@ -0,0 +1,66 @@
+# pylint: disable=C0116, C0114
+
+import unittest
+
+from ssvlogger import journal, logger
+from ssvlogger.record import parse_json
+
+
+class ParseJsonTest(unittest.TestCase):
+    """parse_json skips lines that are valid JSON but not a log"""
+
+    def test_log(self):
+        record = parse_json('{"L":"INFO","T":"2024-05-01T10:11:12.123Z","M":"hi","slot":1}')
+        self.assertEqual(
+            (record.time, record.level, record.component, record.message),
+            ("2024-05-01T10:11:12.123Z", "INFO", None, "hi"),
+        )
+        self.assertEqual(record.fields["slot"], 1)
+
+    def test_not_json(self):
+        self.assertIsNone(parse_json('{"L":"INFO","T":"2024-05-01T10'))
+
+    def test_number(self):
+        self.assertIsNone(parse_json("123"))
+
+    def test_string(self):
+        self.assertIsNone(parse_json('"x"'))
+
+    def test_missing_keys(self):
+        self.assertIsNone(parse_json('{"a":1}'))
+        self.assertIsNone(parse_json('{"T":"2024-05-01T10:11:12.123Z","M":"hi"}'))
+        self.assertIsNone(parse_json('{"L":"INFO","T":"2024-05-01T10:11:12.123Z"}'))
+
+    def test_wrong_types(self):
+        self.assertIsNone(parse_json('{"L":"INFO","T":"2024-05-01T10:11:12.123Z","M":1}'))
+        self.assertIsNone(parse_json('{"L":1,"T":"2024-05-01T10:11:12.123Z","M":"hi"}'))
+        self.assertIsNone(
+            parse_json('{"L":"INFO","T":"2024-05-01T10:11:12.123Z","N":["P2P"],"M":"hi"}')
+        )
+
+
+class ParseEntryTest(unittest.TestCase):
+    """Journal entries holding JSON lines are checked as parse_json does"""
+
+    ENTRY = {"__REALTIME_TIMESTAMP": "1714558272123456"}
+
+    def test_defaults(self):
+        record = journal.parse_entry(self.ENTRY, '{"N":"P2PNetwork","M":"hi"}')
+        self.assertEqual(
+            (record.time, record.level, record.component, record.message),
+            ("2024-05-01T10:11:12.123456Z", "INFO", "P2PNetwork", "hi"),
+        )
+
+    def test_wrong_types(self):
+        for line in ('{"M":1}', '{"N":{},"M":"hi"}', '{"L":null,"M":"hi"}', "[1]"):
+            with self.subTest(line=line):
+                self.assertIsNone(journal.parse_entry(self.ENTRY, line))
+
+    def test_render(self):
+        args = logger.parse_args(["--input", "journal-json"])
+        entry = {**self.ENTRY, "MESSAGE": '{"N":"Controller","M":5}'}
+        self.assertEqual(logger.render_journal_entry(entry, args), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
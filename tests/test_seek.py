@@ -0,0 +1,75 @@
+# pylint: disable=C0116, C0114
+
+import os
+import tempfile
+import unittest
+
+from ssvlogger.seek import parse_time, time_range
+
+# One log every 10 seconds, with stray lines in between
+LINES = [
+    f"2024-05-01T10:{second // 60:02d}:{second % 60:02d}.000000Z\tINFO\tP2PNetwork\tlog {second}\n"
+    + ("stray output\n" if second % 30 == 0 else "")
+    for second in range(0, 600, 10)
+]
+
+
+class ParseTimeTest(unittest.TestCase):
+    """Times given are compared with the UTC times zap writes"""
+
+    def test_naive(self):
+        self.assertEqual(parse_time("2024-05-01T10:00"), "2024-05-01T10:00")
+        self.assertEqual(parse_time("2024-05-01 10:00:05"), "2024-05-01T10:00:05")
+
+    def test_offset(self):
+        self.assertEqual(parse_time("2024-05-01T12:00+02:00"), "2024-05-01T10:00:00")
+        self.assertEqual(parse_time("2024-05-01T10:00Z"), "2024-05-01T10:00:00")
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            parse_time("yesterday")
+
+
+class TimeRangeTest(unittest.TestCase):
+    """time_range finds the same lines as reading the whole file"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            out.writelines(LINES)
+        with open(self.path, "rb") as inp:
+            self.data = inp.read()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def logs(self, since: str | None, until: str | None) -> list[str]:
+        start, end = time_range(self.path, "docker", since, until)
+        return [line for line in self.data[start:end].decode().splitlines() if line[0] == "2"]
+
+    def test_bounds(self):
+        for since in (None, "2024-05-01T09", "2024-05-01T10:00:00", "2024-05-01T10:03:05"):
+            for until in (None, "2024-05-01T10:03:10", "2024-05-01T10:07", "2024-05-01T11"):
+                with self.subTest(since=since, until=until):
+                    expected = [
+                        line.partition("\n")[0]
+                        for line in LINES
+                        if (since is None or line >= since) and (until is None or line < until)
+                    ]
+                    self.assertEqual(self.logs(since, until), expected)
+
+    def test_stray_lines_kept(self):
+        start, end = time_range(self.path, "docker", "2024-05-01T10:00:30", "2024-05-01T10:00:40")
+        self.assertEqual(
+            self.data[start:end].decode(),
+            "2024-05-01T10:00:30.000000Z\tINFO\tP2PNetwork\tlog 30\nstray output\n",
+        )
+
+    def test_empty(self):
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+        self.assertEqual(time_range(self.path, "docker", "2024-05-01T10", None), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+# pylint: disable=C0116, C0114
+
+import unittest
+from unittest import mock
+
+from ssvlogger import dispatch
+from ssvlogger.matches import root
+from ssvlogger.record import LogRecord
+from ssvlogger.stream import Parser
+
+
+def empty(*_call):
+    return "", ["detail"]
+
+
+class RenderTest(unittest.TestCase):
+    """A matcher returning an empty message shows the log as-is, unless it
+    is a Root matcher"""
+
+    def test_table_matcher(self):
+        index = dispatch.MessageIndex({"hello": (empty, False)})
+        log = LogRecord("2024-05-01T10:11:12.123456Z", "INFO", "Test", "hello", {})
+        parser = Parser()
+        with mock.patch.object(dispatch, "find_component", return_value=index):
+            self.assertFalse(parser.find_matcher(log)[2])
+            record = parser.render(log)
+        self.assertEqual((record.message, record.details), (log.text(), ["detail"]))
+
+    def test_root_matcher(self):
+        log = LogRecord("2024-05-01T10:11:12.123456Z", "INFO", None, "hello", {})
+        parser = Parser()
+        with mock.patch.dict(root.Root, {"empty": (lambda _: True, empty)}, clear=True):
+            self.assertTrue(parser.find_matcher(log)[2])
+            record = parser.render(log)
+        self.assertEqual((record.message, record.details), ("", ["detail"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
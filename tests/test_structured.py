@@ -0,0 +1,50 @@
+# pylint: disable=C0116, C0114
+
+import json
+import unittest
+
+from ssvlogger import logger
+from ssvlogger.structured import TrackedFields
+
+
+def output_json(line: str) -> dict:
+    args = logger.parse_args(["--output", "json"])
+    (out,) = logger.render_json_line(line, args)
+    return json.loads(out)
+
+
+class TrackedFieldsTest(unittest.TestCase):
+    """The fields a matcher reads are the key fields of a log"""
+
+    def test_read(self):
+        fields = TrackedFields({"a": 1, "b": 2})
+        self.assertEqual((fields["a"], fields.get("c")), (1, None))
+        self.assertEqual(fields.read, {"a": 1})
+
+    def test_iterated(self):
+        for read in (list, lambda f: f.keys(), lambda f: f.values(), lambda f: f.items()):
+            fields = TrackedFields({"a": 1, "b": 2})
+            read(fields)
+            self.assertEqual(fields.read, {"a": 1, "b": 2})
+
+    def test_output_json_fields(self):
+        event = output_json(
+            '{"L":"INFO","T":"2024-05-01T10:11:12.123456Z","N":"ConsensusClient",'
+            '"M":"retrieved fork epochs","node_addr":"http://cl:5052",'
+            '"ALTAIR":1,"BELLATRIX":2}'
+        )
+        self.assertEqual(event["matcher"], "consensus.fork_epochs")
+        self.assertEqual(event["fields"]["ALTAIR"], 1)
+        self.assertEqual(event["fields"]["BELLATRIX"], 2)
+        self.assertNotIn("M", event["fields"])
+
+    def test_output_json_no_traceback(self):
+        event = output_json(
+            '{"L":"ERROR","T":"2024-05-01T10:11:12.123456Z","M":"boom",'
+            '"error":"x","errorVerbose":"trace"}'
+        )
+        self.assertEqual(event["fields"], {"error": "x"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# pylint: disable=C0116, C0114
+
+import random
+import unittest
+
+from ssvlogger import logger
+from ssvlogger.summary import ACCURACY, QuantileSketch
+
+LOGS = (
+    '{"L":"DEBUG","T":"2024-05-01T10:11:12.123456Z","N":"Controller_Validator",'
+    '"M":"consensus done","slot":64,"runner_role":"ATTESTER_RUNNER",'
+    '"total_consensus_time":"0.5"}',
+    '{"L":"INFO","T":"2024-05-01T10:11:13.123456Z","N":"DutyScheduler",'
+    '"M":"successfully submitted attestations","slot":64,"handler":"ATTESTER"}',
+    '{"L":"ERROR","T":"2024-05-01T10:11:14.123456Z","N":"DutyScheduler",'
+    '"M":"failed to submit attestation","slot":65,"handler":"ATTESTER"}',
+)
+
+
+def summary(*flags: str) -> str:
+    args = logger.parse_args(["--summary", *flags])
+    for line in LOGS:
+        logger.render_json_line(line, args)
+    return args.summarizer.flush()
+
+
+class QuantileSketchTest(unittest.TestCase):
+    """Quantiles are within the accuracy of the sketch"""
+
+    def test_quantiles(self):
+        rng = random.Random(1)
+        values = [rng.lognormvariate(0, 1) for _ in range(10000)]
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.9, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q), expected, delta=expected * ACCURACY * 2)
+
+    def test_empty(self):
+        self.assertEqual(QuantileSketch().quantile(0.5), 0.0)
+
+
+class SummaryTest(unittest.TestCase):
+    """The summary counts every log, whatever is shown"""
+
+    def test_status(self):
+        status = summary()
+        self.assertIn("epoch 2", status)
+        self.assertIn("(n=1)", status)
+        self.assertIn("1 ok", status)
+        self.assertIn("1 failed", status)
+
+    def test_display_flags(self):
+        status = summary()
+        for flags in (["-s"], ["-v"], ["--level", "ERROR"], ["--component", "P2PNetwork"]):
+            with self.subTest(flags=flags):
+                self.assertEqual(summary(*flags), status)
+
+
+if __name__ == "__main__":
+    unittest.main()